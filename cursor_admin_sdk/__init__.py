@@ -11,11 +11,13 @@ from cursor_admin_sdk.models import (
     PaginationInfo,
     SpendData,
     UsageEvent,
+    UsageEventLite,
     FilteredUsageEvents,
     DashboardDailyMetric,
     DashboardAnalyticsResponse,
     ModelUsage,
     ExtensionUsage,
+    UsageCount,
     TeamMemberSpendInfo,
     TeamSpendResponse,
 )
@@ -44,11 +46,13 @@ __all__ = [
     "PaginationInfo",
     "SpendData",
     "UsageEvent",
+    "UsageEventLite",
     "FilteredUsageEvents",
     "DashboardDailyMetric",
     "DashboardAnalyticsResponse",
     "ModelUsage",
     "ExtensionUsage",
+    "UsageCount",
     "TeamMemberSpendInfo",
     "TeamSpendResponse",
     "CursorSDKError",
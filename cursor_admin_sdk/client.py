@@ -2,21 +2,31 @@
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import math
+import time
+import weakref
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from http.cookies import SimpleCookie
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple, Union
+from urllib.parse import unquote_plus
 import aiohttp
+from pydantic_core import to_json
 from yarl import URL
 
 from cursor_admin_sdk.models import (
     TeamMember, 
     DailyUsageData, 
     DailyUsageResponse,
-    UsageMetrics,
     SpendData,
+    TeamMemberSpend,
     FilteredUsageEvents,
+    UsageEvent,
     PaginationInfo,
     DashboardAnalyticsResponse,
-    TeamSpendResponse
+    TeamSpendResponse,
+    get_list_adapter
 )
 from cursor_admin_sdk.exceptions import (
     CursorAPIError,
@@ -27,10 +37,226 @@ from cursor_admin_sdk.exceptions import (
     CursorTimeoutError,
     CursorValidationError,
 )
-from cursor_admin_sdk.retry import RetryConfig, RetryHandler
+from cursor_admin_sdk.retry import RetryConfig, RetryHandler, parse_retry_after
 
 logger = logging.getLogger(__name__)
 
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MS = timedelta(milliseconds=1)
+_MS_PER_DAY = 86_400_000
+
+# Admin API endpoint paths, resolved against each client's base URL once
+_ENDPOINTS = MappingProxyType({
+    "team_members": URL("/teams/members"),
+    "daily_usage": URL("/teams/daily-usage-data"),
+    "spend": URL("/teams/spend"),
+    "filtered_events": URL("/teams/filtered-usage-events"),
+})
+
+# Dashboard endpoints live on cursor.com rather than the admin API host
+_DASHBOARD_ANALYTICS_URL = URL("https://cursor.com/api/dashboard/get-user-analytics")
+_DASHBOARD_TEAM_SPEND_URL = URL("https://cursor.com/api/dashboard/get-team-spend")
+
+# Maximum span accepted by the daily usage endpoint
+_MAX_DATE_RANGE_DAYS = 90
+
+# Longest X-RateLimit-Reset wait accepted as a plausible rate-limit window
+_MAX_RATE_LIMIT_RESET_SECONDS = 3600
+
+# Shared list adapters from the models registry
+_TEAM_MEMBER_LIST = get_list_adapter("team_members")
+_USAGE_METRIC_LIST = get_list_adapter("usage_metrics")
+
+_DEFAULT_HEADERS = MappingProxyType({
+    "User-Agent": "cursor-admin-sdk/0.1.0",
+    "Accept": "application/json"
+})
+
+# Browser-style headers expected by the cursor.com dashboard endpoints. Passed
+# per request so the shared session's default headers are never mutated.
+_DASHBOARD_HEADERS = MappingProxyType({
+    "accept": "*/*",
+    "accept-language": "en-US,en;q=0.9",
+    "content-type": "application/json",
+    "origin": "https://cursor.com",
+    "referer": "https://cursor.com/dashboard",
+    "sec-fetch-dest": "empty",
+    "sec-fetch-mode": "cors",
+    "sec-fetch-site": "same-origin",
+    "priority": "u=1, i"
+})
+
+
+@lru_cache(maxsize=32)
+def _parse_cookie_string(cookie_string: str) -> Tuple[Tuple[str, str], ...]:
+    """Parse a raw cookie string into (name, value) pairs.
+    
+    The same cookie blob is typically reused for many dashboard calls, so
+    results are cached. Pairs are returned as an immutable tuple so cached
+    results cannot be mutated by callers; wrap the result in dict() to use it.
+    
+    Args:
+        cookie_string: Raw cookie string in format "name1=value1; name2=value2"
+        
+    Returns:
+        Tuple of (cookie name, decoded value) pairs
+    """
+    cookies = []
+    for chunk in cookie_string.split(";"):
+        chunk = chunk.strip()
+        if not chunk or "=" not in chunk:
+            continue
+        name, value = chunk.split("=", 1)
+        cookies.append((name.strip(), unquote_plus(value.strip())))
+    return tuple(cookies)
+
+
+@lru_cache(maxsize=32)
+def _dashboard_headers(cookie_string: str) -> Mapping[str, str]:
+    """Build dashboard request headers with a pre-rendered Cookie header.
+    
+    Cookies are encoded the same way aiohttp encodes a per-request cookies=
+    mapping, but only once per distinct cookie string.
+    
+    Args:
+        cookie_string: Raw cookie string in format "name1=value1; name2=value2"
+        
+    Returns:
+        Read-only mapping of _DASHBOARD_HEADERS plus the Cookie header
+    """
+    cookies = SimpleCookie()
+    for name, value in _parse_cookie_string(cookie_string):
+        cookies[name] = value
+    
+    return MappingProxyType({
+        **_DASHBOARD_HEADERS,
+        "cookie": cookies.output(header="", sep=";").strip()
+    })
+
+
+def _to_epoch_ms(value: Union[datetime, int]) -> int:
+    """Convert a datetime or epoch milliseconds to epoch milliseconds.
+    
+    Ints pass through unchanged. Aware datetimes use exact integer
+    arithmetic; naive datetimes are interpreted as local time, as
+    datetime.timestamp() does.
+    """
+    if isinstance(value, int):
+        return value
+    if value.tzinfo is not None:
+        return (value - _EPOCH_UTC) // _ONE_MS
+    return int(value.timestamp() * 1000)
+
+
+def _epoch_ms_range(
+    start_date: Union[datetime, int], end_date: Union[datetime, int]
+) -> Tuple[int, int]:
+    """Convert and validate a daily usage date range.
+    
+    Returns:
+        Tuple of (start, end) epoch milliseconds
+        
+    Raises:
+        CursorValidationError: If the range is reversed or exceeds
+            _MAX_DATE_RANGE_DAYS
+    """
+    start_epoch_ms = _to_epoch_ms(start_date)
+    end_epoch_ms = _to_epoch_ms(end_date)
+    
+    days = (end_epoch_ms - start_epoch_ms) // _MS_PER_DAY
+    if days > _MAX_DATE_RANGE_DAYS:
+        raise CursorValidationError(
+            f"Date range cannot exceed {_MAX_DATE_RANGE_DAYS} days. Got {days} days."
+        )
+    
+    if days < 0:
+        raise CursorValidationError("End date must be after start date")
+    
+    return start_epoch_ms, end_epoch_ms
+
+
+def _extract_retry_after(response: aiohttp.ClientResponse) -> Optional[int]:
+    """Extract the server's retry hint in seconds.
+    
+    Accepts both Retry-After forms (delay-seconds and HTTP-date) and falls
+    back to X-RateLimit-Reset when Retry-After is absent. Reset values that
+    are already past or implausibly far away (e.g. epoch milliseconds) are
+    ignored so the caller falls back to its own backoff.
+    """
+    retry_after = response.headers.get('Retry-After')
+    if retry_after:
+        seconds = parse_retry_after(retry_after)
+        return None if seconds is None else math.ceil(seconds)
+    
+    rate_limit_reset = response.headers.get('X-RateLimit-Reset')
+    if rate_limit_reset:
+        try:
+            reset = float(rate_limit_reset)
+        except ValueError:
+            logger.warning(f"Invalid X-RateLimit-Reset header: {rate_limit_reset}")
+            return None
+        
+        # Usually epoch seconds; small values are a delay in seconds
+        if reset > 1e9:
+            reset -= time.time()
+        if not 0 < reset <= _MAX_RATE_LIMIT_RESET_SECONDS:
+            logger.warning(f"Ignoring implausible X-RateLimit-Reset header: {rate_limit_reset}")
+            return None
+        return math.ceil(reset)
+    
+    return None
+
+
+async def _raise_unauthorized(response: aiohttp.ClientResponse) -> None:
+    raise CursorAuthError("Authentication failed - check your API key", response.status, response)
+
+
+async def _raise_forbidden(response: aiohttp.ClientResponse) -> None:
+    raise CursorAuthError("Access forbidden - insufficient permissions", response.status, response)
+
+
+async def _raise_rate_limited(response: aiohttp.ClientResponse) -> None:
+    retry_after = _extract_retry_after(response)
+    error_text = await response.text()
+    raise CursorRateLimitError(
+        f"Rate limit exceeded: {error_text}",
+        retry_after=retry_after,
+        response=response
+    )
+
+
+# Statuses with a dedicated exception; other 4xx/5xx fall back to range checks
+_STATUS_HANDLERS: Dict[int, Callable[[aiohttp.ClientResponse], Awaitable[None]]] = {
+    401: _raise_unauthorized,
+    403: _raise_forbidden,
+    429: _raise_rate_limited,
+}
+
+
+async def _raise_for_status(response: aiohttp.ClientResponse) -> None:
+    """Raise the matching SDK exception for an error response.
+    
+    Successful responses return after a single comparison.
+    
+    Raises:
+        CursorAuthError: On 401/403
+        CursorRateLimitError: On 429
+        CursorAPIError: On other 4xx responses
+        CursorServerError: On 5xx responses
+    """
+    status = response.status
+    if status < 400:
+        return
+    
+    handler = _STATUS_HANDLERS.get(status)
+    if handler is not None:
+        await handler(response)
+    
+    error_text = await response.text()
+    if status < 500:
+        raise CursorAPIError(f"Client error {status}: {error_text}", status, response)
+    raise CursorServerError(f"Server error {status}: {error_text}", status, response)
+
 
 class CursorAdminClient:
     """Async client for interacting with the Cursor Admin API.
@@ -41,6 +267,21 @@ class CursorAdminClient:
     
     BASE_URL = "https://api.cursor.com"
     
+    # Connection pool size, and the per-host share so dashboard calls to
+    # cursor.com are not starved by admin API calls (and vice versa)
+    CONNECTION_LIMIT = 32
+    CONNECTION_LIMIT_PER_HOST = 16
+    
+    # Maximum number of pages fetched concurrently by the get_all_* helpers,
+    # matched to the connections available for one host
+    MAX_CONCURRENT_PAGES = CONNECTION_LIMIT_PER_HOST
+    
+    # Connection pools shared by client instances running on the same event
+    # loop (an aiohttp session is bound to the loop that created it), as
+    # loop -> [session, active client contexts]. Each is closed when the last
+    # client context on its loop exits.
+    _shared_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, List[Any]]" = weakref.WeakKeyDictionary()
+    
     def __init__(
         self, 
         api_key: str, 
@@ -58,50 +299,96 @@ class CursorAdminClient:
         """
         self.api_key = api_key
         self.base_url = URL(base_url or self.BASE_URL)
+        self._urls = {name: self.base_url.join(path) for name, path in _ENDPOINTS.items()}
         self.retry_handler = RetryHandler(retry_config or RetryConfig())
         self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self._auth = aiohttp.BasicAuth(api_key, "")
         self._session: Optional[aiohttp.ClientSession] = None
+        # endpoint name -> (ETag, parsed result) for conditional GETs
+        self._etag_cache: Dict[str, Tuple[str, Any]] = {}
     
     async def __aenter__(self) -> "CursorAdminClient":
-        """Enter async context manager, creating the aiohttp session."""
-        # Configure connector for production use
-        connector = aiohttp.TCPConnector(
-            limit=100,
-            ttl_dns_cache=300,
-            use_dns_cache=True,
-            keepalive_timeout=30,
-            enable_cleanup_closed=True
-        )
+        """Enter async context manager, acquiring this loop's shared aiohttp session."""
+        cls = type(self)
+        loop = asyncio.get_running_loop()
+        shared = cls._shared_sessions.get(loop)
+        if shared is None or shared[0].closed:
+            # Configure connector for production use
+            # enable_cleanup_closed is left off: it runs a periodic cleanup
+            # task for half-closed TLS connections, which only matters behind
+            # some proxies. Re-enable if TLS connections leak there.
+            connector = aiohttp.TCPConnector(
+                limit=cls.CONNECTION_LIMIT,
+                limit_per_host=cls.CONNECTION_LIMIT_PER_HOST,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                keepalive_timeout=30
+            )
+            
+            # Auth, base URL and timeout are per client, so they are applied
+            # per request in _make_request rather than baked into the session.
+            # Dashboard cookies are sent as a per-request header; the session
+            # keeps no cookie jar so cookies never leak between clients.
+            session = aiohttp.ClientSession(
+                connector=connector,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                headers=_DEFAULT_HEADERS,
+                raise_for_status=False  # Handle status codes manually
+            )
+            shared = [session, 0]
+            cls._shared_sessions[loop] = shared
         
-        self._session = aiohttp.ClientSession(
-            base_url=str(self.base_url),
-            auth=aiohttp.BasicAuth(self.api_key, ""),
-            connector=connector,
-            timeout=self.timeout,
-            headers={
-                "User-Agent": "cursor-admin-sdk/0.1.0",
-                "Accept": "application/json"
-            },
-            raise_for_status=False  # Handle status codes manually
-        )
+        shared[1] += 1
+        self._session = shared[0]
         return self
     
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Exit async context manager, closing the aiohttp session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        """Exit async context manager, closing the shared session once unused."""
+        if self._session is None:
+            return
+        
+        cls = type(self)
+        session = self._session
+        self._session = None
+        
+        loop = asyncio.get_running_loop()
+        shared = cls._shared_sessions.get(loop)
+        if shared is not None and shared[0] is session:
+            shared[1] -= 1
+            if shared[1] > 0:
+                return
+            del cls._shared_sessions[loop]
+        
+        if not session.closed:
+            await session.close()
     
-    async def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+    async def _make_request(self, method: str, endpoint: Union[str, URL], **kwargs) -> bytes:
+        """Make an HTTP request and return the raw JSON response body.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path, or an absolute URL
+            **kwargs: Additional arguments for the request
+            
+        Returns:
+            Raw JSON response body, validated by the caller with pydantic's
+            JSON parser instead of being decoded to Python objects first
+        """
+        _, _, body = await self._request(method, endpoint, **kwargs)
+        return body
+    
+    async def _request(
+        self, method: str, endpoint: Union[str, URL], **kwargs
+    ) -> Tuple[int, Mapping[str, str], bytes]:
         """Make an HTTP request with comprehensive error handling.
         
         Args:
             method: HTTP method (GET, POST, etc.)
-            endpoint: API endpoint path
+            endpoint: API endpoint path, or an absolute URL used as is
             **kwargs: Additional arguments for the request
             
         Returns:
-            Parsed JSON response data
+            Tuple of (status, response headers, raw response body)
             
         Raises:
             CursorValidationError: If session is not initialized
@@ -110,34 +397,25 @@ class CursorAdminClient:
         if not self._session:
             raise CursorValidationError("Client must be used as an async context manager")
         
+        kwargs.setdefault("auth", self._auth)
+        kwargs.setdefault("timeout", self.timeout)
+        if isinstance(endpoint, URL) and endpoint.is_absolute():
+            url = endpoint
+        else:
+            url = self.base_url.join(URL(endpoint))
+        
+        # Encode JSON bodies straight to bytes instead of aiohttp's json.dumps
+        payload = kwargs.pop("json", None)
+        if payload is not None:
+            kwargs["data"] = aiohttp.BytesPayload(to_json(payload), content_type="application/json")
+        
         try:
-            async with self._session.request(method, endpoint, **kwargs) as response:
-                # Handle different response scenarios
-                if response.status == 401:
-                    raise CursorAuthError("Authentication failed - check your API key", response.status, response)
-                
-                elif response.status == 403:
-                    raise CursorAuthError("Access forbidden - insufficient permissions", response.status, response)
-                
-                elif response.status == 429:
-                    retry_after = self._extract_retry_after(response)
-                    error_text = await response.text()
-                    raise CursorRateLimitError(
-                        f"Rate limit exceeded: {error_text}",
-                        retry_after=retry_after,
-                        response=response
-                    )
-                
-                elif 400 <= response.status < 500:
-                    error_text = await response.text()
-                    raise CursorAPIError(f"Client error {response.status}: {error_text}", response.status, response)
-                
-                elif response.status >= 500:
-                    error_text = await response.text()
-                    raise CursorServerError(f"Server error {response.status}: {error_text}", response.status, response)
+            async with self._session.request(method, url, **kwargs) as response:
+                # Raise SDK exceptions for error statuses
+                await _raise_for_status(response)
                 
                 # Success case
-                return await response.json()
+                return response.status, response.headers, await response.read()
                 
         except asyncio.TimeoutError as e:
             logger.error(f"Timeout error for {method} {endpoint}")
@@ -151,17 +429,29 @@ class CursorAdminClient:
             logger.error(f"Client error: {e}")
             raise CursorNetworkError(f"HTTP client error: {e}") from e
     
-    def _extract_retry_after(self, response: aiohttp.ClientResponse) -> Optional[int]:
-        """Extract Retry-After header value in seconds."""
-        retry_after = response.headers.get('Retry-After')
-        if not retry_after:
-            return None
+    async def _post_and_parse(
+        self,
+        endpoint: Union[str, URL],
+        payload: Dict[str, Any],
+        parse: Callable[[bytes], Any],
+        **kwargs
+    ) -> Any:
+        """POST a prebuilt payload and parse the JSON body.
         
-        try:
-            return int(retry_after)
-        except ValueError:
-            logger.warning(f"Invalid Retry-After header: {retry_after}")
-            return None
+        Endpoint methods pass this to execute_with_retry together with its
+        arguments, so retries reuse the same payload instead of rebuilding it.
+        
+        Args:
+            endpoint: API endpoint path, or an absolute URL
+            payload: JSON request body
+            parse: Validator for the raw response body, e.g. model_validate_json
+            **kwargs: Additional arguments for the request, e.g. headers
+            
+        Returns:
+            The parsed response
+        """
+        body = await self._make_request("POST", endpoint, json=payload, **kwargs)
+        return parse(body)
     
     async def get_team_members(self) -> List[TeamMember]:
         """Fetch all team members.
@@ -172,20 +462,33 @@ class CursorAdminClient:
         Raises:
             CursorSDKError: Various SDK-specific exceptions based on error type
         """
-        async def _fetch_members():
-            data = await self._make_request("GET", "/teams/members")
-            return [TeamMember.model_validate(member) for member in data]
+        return await self.retry_handler.execute_with_retry(self._fetch_team_members)
+    
+    async def _fetch_team_members(self) -> List[TeamMember]:
+        """Fetch team members once, revalidating any cached response by ETag."""
+        cached = self._etag_cache.get("team_members")
+        headers = {"If-None-Match": cached[0]} if cached else None
         
-        return await self.retry_handler.execute_with_retry(_fetch_members)
+        status, response_headers, body = await self._request(
+            "GET", self._urls["team_members"], headers=headers
+        )
+        if status == 304 and cached:
+            return list(cached[1])
+        
+        members = _TEAM_MEMBER_LIST.validate_json(body)
+        etag = response_headers.get("ETag")
+        if etag:
+            self._etag_cache["team_members"] = (etag, members)
+        return list(members)
     
     async def get_daily_usage_data(
-        self, start_date: datetime, end_date: datetime
+        self, start_date: Union[datetime, int], end_date: Union[datetime, int]
     ) -> DailyUsageData:
         """Fetch daily usage data for a specific date range.
         
         Args:
-            start_date: Start date for the usage data query
-            end_date: End date for the usage data query
+            start_date: Start date for the usage data query (datetime or epoch ms)
+            end_date: End date for the usage data query (datetime or epoch ms)
             
         Returns:
             DailyUsageData model containing usage metrics for each day
@@ -194,47 +497,35 @@ class CursorAdminClient:
             CursorValidationError: If date range is invalid
             CursorSDKError: Various SDK-specific exceptions based on error type
         """
-        # Validate date range (90-day limit)
-        date_diff = end_date - start_date
-        if date_diff.days > 90:
-            raise CursorValidationError(
-                f"Date range cannot exceed 90 days. Got {date_diff.days} days."
-            )
-        
-        if date_diff.days < 0:
-            raise CursorValidationError("End date must be after start date")
-        
-        # Convert dates to epoch milliseconds
-        start_epoch_ms = int(start_date.timestamp() * 1000)
-        end_epoch_ms = int(end_date.timestamp() * 1000)
-        
-        async def _fetch_usage_data():
-            payload = {
-                "startDate": start_epoch_ms,
-                "endDate": end_epoch_ms
-            }
-            
-            data = await self._make_request("POST", "/teams/daily-usage-data", json=payload)
-            
-            # Parse the response into models
-            usage_metrics = [UsageMetrics.model_validate(metric) for metric in data]
-            
-            return DailyUsageData(
-                usage_data=usage_metrics,
-                start_date=start_date,
-                end_date=end_date
-            )
+        # Convert to epoch milliseconds and validate range (90-day limit)
+        start_epoch_ms, end_epoch_ms = _epoch_ms_range(start_date, end_date)
+        
+        payload = {
+            "startDate": start_epoch_ms,
+            "endDate": end_epoch_ms
+        }
+        
+        usage_metrics = await self.retry_handler.execute_with_retry(
+            self._post_and_parse,
+            self._urls["daily_usage"],
+            payload,
+            _USAGE_METRIC_LIST.validate_json
+        )
         
-        return await self.retry_handler.execute_with_retry(_fetch_usage_data)
+        return DailyUsageData(
+            usage_data=usage_metrics,
+            start_date=start_date,
+            end_date=end_date
+        )
     
     async def get_detailed_daily_usage(
-        self, start_date: datetime, end_date: datetime
+        self, start_date: Union[datetime, int], end_date: Union[datetime, int]
     ) -> DailyUsageResponse:
         """Fetch detailed daily usage data with comprehensive metrics.
         
         Args:
-            start_date: Start date for the usage data query
-            end_date: End date for the usage data query
+            start_date: Start date for the usage data query (datetime or epoch ms)
+            end_date: End date for the usage data query (datetime or epoch ms)
             
         Returns:
             DailyUsageResponse containing detailed daily metrics
@@ -243,35 +534,26 @@ class CursorAdminClient:
             CursorValidationError: If date range is invalid
             CursorSDKError: Various SDK-specific exceptions based on error type
         """
-        # Validate date range (90-day limit)
-        date_diff = end_date - start_date
-        if date_diff.days > 90:
-            raise CursorValidationError(
-                f"Date range cannot exceed 90 days. Got {date_diff.days} days."
-            )
-        
-        if date_diff.days < 0:
-            raise CursorValidationError("End date must be after start date")
-        
-        # Convert dates to epoch milliseconds
-        start_epoch_ms = int(start_date.timestamp() * 1000)
-        end_epoch_ms = int(end_date.timestamp() * 1000)
+        # Convert to epoch milliseconds and validate range (90-day limit)
+        start_epoch_ms, end_epoch_ms = _epoch_ms_range(start_date, end_date)
+        
+        payload = {
+            "startDate": start_epoch_ms,
+            "endDate": end_epoch_ms
+        }
+        
+        result = await self.retry_handler.execute_with_retry(
+            self._post_and_parse,
+            self._urls["daily_usage"],
+            payload,
+            DailyUsageResponse.model_validate_json
+        )
         
-        async def _fetch_detailed_usage_data():
-            payload = {
-                "startDate": start_epoch_ms,
-                "endDate": end_epoch_ms
-            }
-            
-            data = await self._make_request("POST", "/teams/daily-usage-data", json=payload)
-            
-            # Debug: Check if the response contains per-user data
-            if data.get("data") and len(data["data"]) > 0:
-                logger.debug(f"Daily usage response contains {len(data['data'])} entries with per-user data")
-            
-            return DailyUsageResponse.model_validate(data)
+        # Debug: Check if the response contains per-user data
+        if result.data:
+            logger.debug(f"Daily usage response contains {len(result.data)} entries with per-user data")
         
-        return await self.retry_handler.execute_with_retry(_fetch_detailed_usage_data)
+        return result
     
     async def get_spend_data(
         self,
@@ -307,31 +589,32 @@ class CursorAdminClient:
         if sort_by is not None and sort_by not in ("amount", "date", "user"):
             raise CursorValidationError("sort_by must be 'amount', 'date', or 'user'")
         
-        async def _fetch_spend_data():
-            # Build payload
-            payload = {
-                "page": page,
-                "sortDirection": sort_direction
-            }
-            
-            if page_size is not None:
-                payload["pageSize"] = page_size
-            if search_term is not None:
-                payload["searchTerm"] = search_term
-            if sort_by is not None:
-                payload["sortBy"] = sort_by
-            
-            data = await self._make_request("POST", "/teams/spend", json=payload)
-            return SpendData.model_validate(data)
-        
-        return await self.retry_handler.execute_with_retry(_fetch_spend_data)
+        # Build payload
+        payload = {
+            "page": page,
+            "sortDirection": sort_direction
+        }
+        
+        if page_size is not None:
+            payload["pageSize"] = page_size
+        if search_term is not None:
+            payload["searchTerm"] = search_term
+        if sort_by is not None:
+            payload["sortBy"] = sort_by
+        
+        return await self.retry_handler.execute_with_retry(
+            self._post_and_parse,
+            self._urls["spend"],
+            payload,
+            SpendData.model_validate_json
+        )
     
     async def get_usage_events(
         self,
         page: int = 1,
         page_size: int = 10,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
+        start_date: Optional[Union[datetime, int]] = None,
+        end_date: Optional[Union[datetime, int]] = None,
         user_id: Optional[str] = None,
         email: Optional[str] = None
     ) -> FilteredUsageEvents:
@@ -340,8 +623,8 @@ class CursorAdminClient:
         Args:
             page: Page number (1-indexed, default: 1)
             page_size: Results per page (default: 10)
-            start_date: Filter events from this date (optional)
-            end_date: Filter events until this date (optional)
+            start_date: Filter events from this date, datetime or epoch ms (optional)
+            end_date: Filter events until this date, datetime or epoch ms (optional)
             user_id: Filter by specific user ID (optional)
             email: Filter by user email (optional)
             
@@ -359,43 +642,122 @@ class CursorAdminClient:
         if page_size < 1:
             raise CursorValidationError("page_size must be >= 1")
         
-        if start_date and end_date and start_date > end_date:
+        start_epoch_ms = _to_epoch_ms(start_date) if start_date is not None else None
+        end_epoch_ms = _to_epoch_ms(end_date) if end_date is not None else None
+        
+        if start_epoch_ms is not None and end_epoch_ms is not None and start_epoch_ms > end_epoch_ms:
             raise CursorValidationError("start_date must be before end_date")
         
-        async def _fetch_usage_events():
-            # Build payload
-            payload = {
-                "page": page,
-                "pageSize": page_size
-            }
+        # Build payload
+        payload = {
+            "page": page,
+            "pageSize": page_size
+        }
+        
+        # Add optional filters
+        if start_epoch_ms is not None:
+            payload["startDate"] = start_epoch_ms
+        if end_epoch_ms is not None:
+            payload["endDate"] = end_epoch_ms
+        if user_id is not None:
+            payload["userId"] = user_id
+        if email is not None:
+            payload["email"] = email
+        
+        result = await self.retry_handler.execute_with_retry(
+            self._post_and_parse,
+            self._urls["filtered_events"],
+            payload,
+            FilteredUsageEvents.model_validate_json
+        )
+        
+        # Debug: Log the first event to see actual structure
+        if result.events:
+            logger.debug(f"Sample event from API: {result.events[0]!r}")
+        
+        return result
+    
+    async def _fetch_remaining_pages(
+        self,
+        fetch_page: Callable[..., Awaitable[Any]],
+        num_pages: int,
+        filters: Dict[str, Any]
+    ) -> List[Any]:
+        """Fetch pages 2..num_pages concurrently, bounded by MAX_CONCURRENT_PAGES.
+        
+        Each page goes through the endpoint method, so rate-limited pages are
+        retried with backoff like any other request.
+        
+        Returns:
+            Page results in page order
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PAGES)
+        
+        async def _fetch_page(page: int) -> Any:
+            async with semaphore:
+                return await fetch_page(page=page, **filters)
+        
+        return await asyncio.gather(*(_fetch_page(page) for page in range(2, num_pages + 1)))
+    
+    async def get_all_spend_data(self, **filters: Any) -> List[TeamMemberSpend]:
+        """Fetch team spending data across all pages.
+        
+        The first page is fetched to learn the page count, then the remaining
+        pages are fetched concurrently.
+        
+        Args:
+            **filters: Any get_spend_data arguments other than page
             
-            # Add optional filters
-            if start_date is not None:
-                payload["startDate"] = int(start_date.timestamp() * 1000)
-            if end_date is not None:
-                payload["endDate"] = int(end_date.timestamp() * 1000)
-            if user_id is not None:
-                payload["userId"] = user_id
-            if email is not None:
-                payload["email"] = email
+        Returns:
+            List of TeamMemberSpend entries from every page, in page order
             
-            data = await self._make_request("POST", "/teams/filtered-usage-events", json=payload)
+        Raises:
+            CursorValidationError: If parameters are invalid
+            CursorSDKError: Various SDK-specific exceptions based on error type
+        """
+        first_page = await self.get_spend_data(page=1, **filters)
+        pages = await self._fetch_remaining_pages(
+            self.get_spend_data, first_page.pagination.num_pages, filters
+        )
+        
+        team_members = list(first_page.team_members)
+        for spend_page in pages:
+            team_members.extend(spend_page.team_members)
+        return team_members
+    
+    async def get_all_usage_events(self, **filters: Any) -> List[UsageEvent]:
+        """Fetch filtered usage events across all pages.
+        
+        The first page is fetched to learn the page count, then the remaining
+        pages are fetched concurrently.
+        
+        Args:
+            **filters: Any get_usage_events arguments other than page
             
-            # Debug: Log the first event to see actual structure
-            if data.get("usageEvents") and len(data["usageEvents"]) > 0:
-                logger.debug(f"Sample raw event from API: {data['usageEvents'][0]}")
+        Returns:
+            List of UsageEvent entries from every page, in page order
             
-            return FilteredUsageEvents.model_validate(data)
+        Raises:
+            CursorValidationError: If parameters are invalid
+            CursorSDKError: Various SDK-specific exceptions based on error type
+        """
+        first_page = await self.get_usage_events(page=1, **filters)
+        pages = await self._fetch_remaining_pages(
+            self.get_usage_events, first_page.pagination.num_pages, filters
+        )
         
-        return await self.retry_handler.execute_with_retry(_fetch_usage_events)
+        events = list(first_page.events)
+        for events_page in pages:
+            events.extend(events_page.events)
+        return events
     
     async def get_dashboard_analytics(
         self,
         cookie_string: str,
         team_id: int,
         user_id: int,
-        start_date: datetime,
-        end_date: datetime
+        start_date: Union[datetime, int],
+        end_date: Union[datetime, int]
     ) -> DashboardAnalyticsResponse:
         """Fetch user analytics from the dashboard API endpoint.
         
@@ -406,8 +768,8 @@ class CursorAdminClient:
             cookie_string: Raw cookie string from authenticated browser session
             team_id: Team ID from Cursor dashboard
             user_id: User ID from Cursor dashboard
-            start_date: Start date for analytics query
-            end_date: End date for analytics query
+            start_date: Start date for analytics query (datetime or epoch ms)
+            end_date: End date for analytics query (datetime or epoch ms)
             
         Returns:
             DashboardAnalyticsResponse containing daily metrics and team statistics
@@ -417,79 +779,27 @@ class CursorAdminClient:
             CursorValidationError: If parameters are invalid
             CursorSDKError: Various SDK-specific exceptions based on error type
         """
-        # Save current session state
-        original_headers = dict(self._session.headers) if self._session else {}
-        
-        try:
-            # Parse cookies from string
-            cookies = self._parse_cookie_string(cookie_string)
-            
-            # Convert dates to epoch milliseconds strings
-            start_epoch_ms = str(int(start_date.timestamp() * 1000))
-            end_epoch_ms = str(int(end_date.timestamp() * 1000))
-            
-            # Prepare dashboard-specific headers
-            dashboard_headers = {
-                "accept": "*/*",
-                "accept-language": "en-US,en;q=0.9",
-                "content-type": "application/json",
-                "origin": "https://cursor.com",
-                "referer": "https://cursor.com/dashboard",
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-origin",
-                "priority": "u=1, i"
-            }
-            
-            # Update session headers temporarily
-            if self._session:
-                self._session.headers.update(dashboard_headers)
-            
-            async def _fetch_dashboard_analytics():
-                payload = {
-                    "teamId": team_id,
-                    "userId": user_id,
-                    "startDate": start_epoch_ms,
-                    "endDate": end_epoch_ms
-                }
-                
-                # Make request with cookies
-                data = await self._make_request(
-                    "POST", 
-                    "https://cursor.com/api/dashboard/get-user-analytics",
-                    json=payload,
-                    cookies=cookies
-                )
-                
-                return DashboardAnalyticsResponse.model_validate(data)
-            
-            return await self.retry_handler.execute_with_retry(_fetch_dashboard_analytics)
-            
-        finally:
-            # Restore original headers
-            if self._session and original_headers:
-                self._session.headers.clear()
-                self._session.headers.update(original_headers)
-    
-    def _parse_cookie_string(self, cookie_string: str) -> Dict[str, str]:
-        """Parse a raw cookie string into a dictionary.
-        
-        Args:
-            cookie_string: Raw cookie string in format "name1=value1; name2=value2"
-            
-        Returns:
-            Dictionary of cookie names to values
-        """
-        from urllib.parse import unquote_plus
-        
-        cookies = {}
-        for chunk in cookie_string.split(";"):
-            chunk = chunk.strip()
-            if not chunk or "=" not in chunk:
-                continue
-            name, value = chunk.split("=", 1)
-            cookies[name.strip()] = unquote_plus(value.strip())
-        return cookies
+        # Dashboard headers with the cookies pre-rendered
+        headers = _dashboard_headers(cookie_string)
+        
+        # Convert dates to epoch milliseconds strings
+        start_epoch_ms = str(_to_epoch_ms(start_date))
+        end_epoch_ms = str(_to_epoch_ms(end_date))
+        
+        payload = {
+            "teamId": team_id,
+            "userId": user_id,
+            "startDate": start_epoch_ms,
+            "endDate": end_epoch_ms
+        }
+        
+        return await self.retry_handler.execute_with_retry(
+            self._post_and_parse,
+            _DASHBOARD_ANALYTICS_URL,
+            payload,
+            DashboardAnalyticsResponse.model_validate_json,
+            headers=headers
+        )
     
     async def get_team_spend(
         self,
@@ -513,49 +823,17 @@ class CursorAdminClient:
             CursorValidationError: If parameters are invalid
             CursorSDKError: Various SDK-specific exceptions based on error type
         """
-        # Save current session state
-        original_headers = dict(self._session.headers) if self._session else {}
-        
-        try:
-            # Parse cookies from string
-            cookies = self._parse_cookie_string(cookie_string)
-            
-            # Prepare dashboard-specific headers
-            dashboard_headers = {
-                "accept": "*/*",
-                "accept-language": "en-US,en;q=0.9",
-                "content-type": "application/json",
-                "origin": "https://cursor.com",
-                "referer": "https://cursor.com/dashboard",
-                "sec-fetch-dest": "empty",
-                "sec-fetch-mode": "cors",
-                "sec-fetch-site": "same-origin",
-                "priority": "u=1, i"
-            }
-            
-            # Update session headers temporarily
-            if self._session:
-                self._session.headers.update(dashboard_headers)
-            
-            async def _fetch_team_spend():
-                payload = {
-                    "teamId": team_id
-                }
-                
-                # Make request with cookies
-                data = await self._make_request(
-                    "POST", 
-                    "https://cursor.com/api/dashboard/get-team-spend",
-                    json=payload,
-                    cookies=cookies
-                )
-                
-                return TeamSpendResponse.model_validate(data)
-            
-            return await self.retry_handler.execute_with_retry(_fetch_team_spend)
-            
-        finally:
-            # Restore original headers
-            if self._session and original_headers:
-                self._session.headers.clear()
-                self._session.headers.update(original_headers)
\ No newline at end of file
+        # Dashboard headers with the cookies pre-rendered
+        headers = _dashboard_headers(cookie_string)
+        
+        payload = {
+            "teamId": team_id
+        }
+        
+        return await self.retry_handler.execute_with_retry(
+            self._post_and_parse,
+            _DASHBOARD_TEAM_SPEND_URL,
+            payload,
+            TeamSpendResponse.model_validate_json,
+            headers=headers
+        )
@@ -61,9 +61,18 @@ class CursorValidationError(CursorSDKError):
 
 
 class CursorRetryExhaustedError(CursorSDKError):
-    """Raised when all retry attempts have been exhausted."""
+    """Raised when all retry attempts have been exhausted.
     
-    def __init__(self, message: str, attempts: int, last_exception: Exception):
+    The final attempt's exception is chained as __cause__ (raise ... from).
+    """
+    
+    def __init__(self, message: str, attempts: int, last_exception: Optional[Exception] = None):
         super().__init__(message)
         self.attempts = attempts
-        self.last_exception = last_exception
\ No newline at end of file
+        if last_exception is not None:
+            self.__cause__ = last_exception
+    
+    @property
+    def last_exception(self) -> Optional[BaseException]:
+        """The exception raised by the final attempt."""
+        return self.__cause__
\ No newline at end of file
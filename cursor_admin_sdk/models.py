@@ -1,8 +1,51 @@
 """Pydantic models for Cursor Admin API responses."""
 
-from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import cached_property
+from types import MappingProxyType
+from typing import Annotated, Any, Callable, ClassVar, Dict, List, Mapping, NamedTuple, Optional, Tuple, Union
+from dateutil import parser as date_parser
+from pydantic import (
+    BaseModel, BeforeValidator, Field, ConfigDict, NonNegativeInt, PlainSerializer, TypeAdapter,
+    field_validator
+)
+
+# Shared tzinfo for epoch timestamps, which the API always reports in UTC
+_UTC = timezone.utc
+
+# Shared read-only stand-in for absent mapping fields
+_EMPTY_MAP: Mapping[str, int] = MappingProxyType({})
+
+
+class _APIModel(BaseModel):
+    """Base for API models whose fields are populated by alias or by name."""
+    
+    # Maps both API aliases and field names to field names, built per subclass
+    _alias_map: ClassVar[Mapping[str, str]] = MappingProxyType({})
+    
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        alias_map = {}
+        for name, field in cls.model_fields.items():
+            alias_map[name] = name
+            if field.alias:
+                alias_map[field.alias] = name
+        cls._alias_map = MappingProxyType(alias_map)
+    
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]):
+        """Build an instance from already-validated data without validation.
+        
+        Keys may be API aliases or field names; unknown keys are dropped.
+        Values must already have their field types: validators, constraints
+        and nested model parsing are all skipped.
+        """
+        alias_map = cls._alias_map
+        return cls.model_construct(**{
+            alias_map[key]: value for key, value in data.items() if key in alias_map
+        })
 
 
 class TeamMember(BaseModel):
@@ -25,14 +68,25 @@ class UsageMetrics(BaseModel):
     ai_suggestion_accepts: int = Field(default=0, ge=0)
     ai_suggestion_rejects: int = Field(default=0, ge=0)
     tab_completions: int = Field(default=0, ge=0)
-    requests_by_type: Dict[str, int] = Field(default_factory=dict)
-    model_usage: Dict[str, int] = Field(default_factory=dict)
+    # None when absent, so empty records do not each allocate a dict
+    requests_by_type: Optional[Dict[str, int]] = None
+    model_usage: Optional[Dict[str, int]] = None
     client_version: Optional[str] = None
     
     model_config = ConfigDict(extra="ignore")
+    
+    @property
+    def requests_by_type_view(self) -> Mapping[str, int]:
+        """Requests by type, or a shared empty mapping when absent."""
+        return self.requests_by_type or _EMPTY_MAP
+    
+    @property
+    def model_usage_view(self) -> Mapping[str, int]:
+        """Model usage counts, or a shared empty mapping when absent."""
+        return self.model_usage or _EMPTY_MAP
 
 
-class DailyUsageMetrics(BaseModel):
+class DailyUsageMetrics(_APIModel):
     """Daily usage metrics with detailed statistics."""
     
     date: int  # Unix timestamp
@@ -61,15 +115,28 @@ class DailyUsageMetrics(BaseModel):
     email: Optional[str] = None
     
     model_config = ConfigDict(extra="ignore", populate_by_name=True)
+    
+    @cached_property
+    def as_datetime(self) -> datetime:
+        """Convert the epoch date to a UTC datetime (computed once per instance).
+        
+        The date itself stays an int so sorting and grouping compare ints.
+        """
+        return _parse_timestamp_epoch(self.date)
+    
+    @classmethod
+    def parse_many(cls, raw: Union[str, bytes]) -> List["DailyUsageMetrics"]:
+        """Validate a JSON array of daily metrics in one pydantic-core pass."""
+        return _ADAPTERS["daily"].validate_json(raw)
 
 
-class DailyUsagePeriod(BaseModel):
+class DailyUsagePeriod(_APIModel):
     """Period information for daily usage data."""
     
     start_date: int = Field(alias="startDate")
     end_date: int = Field(alias="endDate")
     
-    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+    model_config = ConfigDict(extra="ignore", populate_by_name=True)
 
 
 class DailyUsageResponse(BaseModel):
@@ -78,7 +145,7 @@ class DailyUsageResponse(BaseModel):
     data: List[DailyUsageMetrics]
     period: DailyUsagePeriod
     
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="ignore")
 
 
 class DailyUsageData(BaseModel):
@@ -91,7 +158,7 @@ class DailyUsageData(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
-class TeamMemberSpend(BaseModel):
+class TeamMemberSpend(_APIModel):
     """Individual team member spending information."""
     
     email: str
@@ -102,7 +169,7 @@ class TeamMemberSpend(BaseModel):
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
 
-class PaginationInfo(BaseModel):
+class PaginationInfo(_APIModel):
     """Pagination metadata used across endpoints."""
     
     num_pages: int = Field(ge=1, alias="numPages")
@@ -111,20 +178,59 @@ class PaginationInfo(BaseModel):
     has_next_page: bool = Field(default=False, alias="hasNextPage")
     has_previous_page: bool = Field(default=False, alias="hasPreviousPage")
     
-    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+    model_config = ConfigDict(extra="ignore", populate_by_name=True)
 
 
-class SpendData(BaseModel):
+class SpendData(_APIModel):
     """Spending data response with pagination info."""
     
     team_members: List[TeamMemberSpend] = Field(alias="teamMembers")
     total_members: int = Field(ge=0, alias="totalMembers")
     pagination: PaginationInfo
     
-    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+    model_config = ConfigDict(extra="ignore", populate_by_name=True)
+
+
+# Epoch values above this are milliseconds rather than seconds
+_MS_CUTOFF = 10_000_000_000
+
 
+def _parse_timestamp_epoch(v: Union[int, float]) -> datetime:
+    """Parse epoch seconds or milliseconds into a UTC datetime."""
+    if v > _MS_CUTOFF:
+        return datetime.fromtimestamp(v / 1000, tz=_UTC)
+    return datetime.fromtimestamp(v, tz=_UTC)
 
-class UsageEvent(BaseModel):
+
+def _parse_timestamp_str(v: str) -> datetime:
+    """Parse an epoch-milliseconds or ISO 8601 timestamp string."""
+    # Epoch milliseconds string; isdigit() alone also accepts characters
+    # such as '²' that int() rejects
+    if v.isascii() and v.isdecimal():
+        return datetime.fromtimestamp(int(v) / 1000, tz=_UTC)
+    
+    # ISO format; fromisoformat accepts a trailing 'Z' natively on Python 3.11+
+    try:
+        return datetime.fromisoformat(v)
+    except ValueError:
+        # Less common formats
+        return date_parser.parse(v)
+
+
+def _return_datetime(v: datetime) -> datetime:
+    return v
+
+
+# Timestamp parsers keyed by exact input type
+_TS_PARSERS: Mapping[type, Callable[[Any], datetime]] = MappingProxyType({
+    datetime: _return_datetime,
+    str: _parse_timestamp_str,
+    int: _parse_timestamp_epoch,
+    float: _parse_timestamp_epoch,
+})
+
+
+class UsageEvent(_APIModel):
     """Individual usage event with detailed information."""
     
     timestamp: Union[datetime, str, int]
@@ -156,26 +262,52 @@ class UsageEvent(BaseModel):
     @classmethod
     def parse_timestamp(cls, v):
         """Parse timestamp from various formats."""
+        # Exact-type dispatch covers the common inputs with one dict lookup
+        parser = _TS_PARSERS.get(type(v))
+        if parser is not None:
+            return parser(v)
+        
+        # Subclasses of the supported types
         if isinstance(v, datetime):
             return v
         if isinstance(v, str):
-            # Try to parse as epoch milliseconds string
-            try:
-                epoch_ms = int(v)
-                return datetime.fromtimestamp(epoch_ms / 1000)
-            except ValueError:
-                # Try ISO format
-                return datetime.fromisoformat(v.replace('Z', '+00:00'))
+            return _parse_timestamp_str(v)
         if isinstance(v, (int, float)):
-            # Assume epoch milliseconds if the number is large
-            if v > 1e10:
-                return datetime.fromtimestamp(v / 1000)
-            else:
-                return datetime.fromtimestamp(v)
+            return _parse_timestamp_epoch(v)
         raise ValueError(f"Cannot parse timestamp: {v}")
-
-
-class FilteredUsageEvents(BaseModel):
+    
+    @classmethod
+    def parse_many(cls, raw: Union[str, bytes]) -> List["UsageEvent"]:
+        """Validate a JSON array of usage events in one pydantic-core pass."""
+        return _ADAPTERS["events"].validate_json(raw)
+    
+    def to_lite(self) -> "UsageEventLite":
+        """Convert to a compact UsageEventLite holding only analytics fields."""
+        return UsageEventLite(
+            timestamp=self.timestamp,
+            user_email=self.user_email,
+            cursor_model=self.cursor_model,
+            kind=self.kind,
+            max_mode=bool(self.max_mode),
+            requests_costs=self.requests_costs or 0.0,
+            total_tokens=self.total_tokens or 0,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class UsageEventLite:
+    """Slotted, immutable subset of UsageEvent for bulk in-memory analytics."""
+    
+    timestamp: datetime
+    user_email: Optional[str]
+    cursor_model: Optional[str]
+    kind: Optional[str]
+    max_mode: bool
+    requests_costs: float
+    total_tokens: int
+
+
+class FilteredUsageEvents(_APIModel):
     """Filtered usage events response with pagination."""
     
     events: List[UsageEvent] = Field(alias="usageEvents")
@@ -202,10 +334,45 @@ class ExtensionUsage(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
-class DashboardDailyMetric(BaseModel):
+class UsageCount(NamedTuple):
+    """A (name, count) row of a dashboard usage breakdown."""
+    name: str
+    count: NonNegativeInt
+
+
+def _to_name_count(item: Any) -> Any:
+    """Convert one {"name", "count"} object or ModelUsage/ExtensionUsage row into a pair."""
+    if isinstance(item, dict):
+        return (item.get("name"), item.get("count"))
+    if isinstance(item, (ModelUsage, ExtensionUsage)):
+        return (item.name, item.count)
+    return item
+
+
+def _to_name_counts(value: Any) -> Any:
+    """Convert a list of {"name", "count"} objects or usage models into (name, count) pairs."""
+    if value is None:
+        return ()
+    return tuple(_to_name_count(item) for item in value)
+
+
+def _from_name_counts(value: Tuple[UsageCount, ...]) -> List[Dict[str, Any]]:
+    """Serialize (name, count) pairs back to the API's {"name", "count"} objects."""
+    return [row._asdict() for row in value]
+
+
+# UsageCount tuples instead of one model per row; rows still read as .name / .count
+NameCount = Annotated[
+    Tuple[UsageCount, ...],
+    BeforeValidator(_to_name_counts),
+    PlainSerializer(_from_name_counts)
+]
+
+
+class DashboardDailyMetric(_APIModel):
     """Daily metrics from the dashboard API."""
     
-    date: str  # Epoch milliseconds as string
+    date: int  # Epoch milliseconds (sent as a string, coerced on validation)
     active_users: Optional[int] = Field(default=0, alias="activeUsers")
     lines_added: Optional[int] = Field(default=0, ge=0, alias="linesAdded")
     lines_deleted: Optional[int] = Field(default=0, ge=0, alias="linesDeleted") 
@@ -220,20 +387,25 @@ class DashboardDailyMetric(BaseModel):
     composer_requests: Optional[int] = Field(default=0, ge=0, alias="composerRequests")
     subscription_included_reqs: Optional[int] = Field(default=0, ge=0, alias="subscriptionIncludedReqs")
     usage_based_reqs: Optional[int] = Field(default=0, ge=0, alias="usageBasedReqs")
-    model_usage: Optional[List[ModelUsage]] = Field(default_factory=list, alias="modelUsage")
-    extension_usage: Optional[List[ExtensionUsage]] = Field(default_factory=list, alias="extensionUsage")
-    tab_extension_usage: Optional[List[ExtensionUsage]] = Field(default_factory=list, alias="tabExtensionUsage")
-    client_version_usage: Optional[List[ExtensionUsage]] = Field(default_factory=list, alias="clientVersionUsage")
+    # (name, count) pairs; immutable so the empty default is shared across records
+    model_usage: NameCount = Field(default=(), alias="modelUsage")
+    extension_usage: NameCount = Field(default=(), alias="extensionUsage")
+    tab_extension_usage: NameCount = Field(default=(), alias="tabExtensionUsage")
+    client_version_usage: NameCount = Field(default=(), alias="clientVersionUsage")
     
     model_config = ConfigDict(extra="ignore", populate_by_name=True)
     
-    @property
+    @cached_property
     def timestamp(self) -> datetime:
-        """Convert date string to datetime."""
-        return datetime.fromtimestamp(int(self.date) / 1000)
+        """Convert epoch milliseconds to an aware local datetime (computed once per instance).
+        
+        Aware like UsageEvent's epoch timestamps, so the two compare directly,
+        while keeping the local wall-clock date used for daily breakdowns.
+        """
+        return datetime.fromtimestamp(self.date / 1000, tz=_UTC).astimezone()
 
 
-class DashboardAnalyticsPeriod(BaseModel):
+class DashboardAnalyticsPeriod(_APIModel):
     """Period info for dashboard analytics."""
     
     start_date: str = Field(alias="startDate")
@@ -242,7 +414,7 @@ class DashboardAnalyticsPeriod(BaseModel):
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
 
-class DashboardAnalyticsResponse(BaseModel):
+class DashboardAnalyticsResponse(_APIModel):
     """Response from dashboard get-user-analytics endpoint."""
     
     daily_metrics: List[DashboardDailyMetric] = Field(alias="dailyMetrics")
@@ -259,7 +431,7 @@ class DashboardAnalyticsResponse(BaseModel):
     model_config = ConfigDict(extra="ignore", populate_by_name=True)
 
 
-class TeamMemberSpendInfo(BaseModel):
+class TeamMemberSpendInfo(_APIModel):
     """Individual team member spend information from the dashboard API."""
     
     user_id: int = Field(alias="userId")
@@ -273,7 +445,7 @@ class TeamMemberSpendInfo(BaseModel):
     model_config = ConfigDict(extra="ignore", populate_by_name=True)
 
 
-class TeamSpendResponse(BaseModel):
+class TeamSpendResponse(_APIModel):
     """Response from dashboard get-team-spend endpoint."""
     
     team_member_spend: List[TeamMemberSpendInfo] = Field(alias="teamMemberSpend")
@@ -281,4 +453,28 @@ class TeamSpendResponse(BaseModel):
     total_members: int = Field(alias="totalMembers")
     total_pages: int = Field(alias="totalPages")
     
-    model_config = ConfigDict(extra="ignore", populate_by_name=True)
\ No newline at end of file
+    model_config = ConfigDict(extra="ignore", populate_by_name=True)
+
+
+# List adapters for bulk validation, built once since constructing them is costly
+_ADAPTERS: Mapping[str, TypeAdapter] = MappingProxyType({
+    "team_members": TypeAdapter(List[TeamMember]),
+    "usage_metrics": TypeAdapter(List[UsageMetrics]),
+    "events": TypeAdapter(List[UsageEvent]),
+    "daily": TypeAdapter(List[DailyUsageMetrics]),
+    "dashboard_daily": TypeAdapter(List[DashboardDailyMetric]),
+    "spend_info": TypeAdapter(List[TeamMemberSpendInfo]),
+})
+
+
+def get_list_adapter(name: str) -> TypeAdapter:
+    """Return the shared list TypeAdapter registered under name.
+    
+    Args:
+        name: One of "team_members", "usage_metrics", "events", "daily",
+            "dashboard_daily" or "spend_info"
+        
+    Raises:
+        KeyError: If no adapter is registered under name
+    """
+    return _ADAPTERS[name]
@@ -2,9 +2,11 @@
 
 import asyncio
 import logging
+import math
 import random
-import time
-from typing import Any, Callable, Dict, Optional, Set, Type, Union
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Type, Union
 import aiohttp
 
 from cursor_admin_sdk.exceptions import (
@@ -17,6 +19,46 @@ from cursor_admin_sdk.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Rate-limit waits whose deadlines fall within this many seconds share a timer
+_RATE_LIMIT_GATE_TOLERANCE = 0.1
+
+
+def parse_retry_after(retry_after: str) -> Optional[float]:
+    """Parse a Retry-After header value into seconds.
+    
+    Handles delay-seconds, checking the common integer form without raising,
+    and the HTTP-date form. Returns None for invalid values, including
+    delays that are not finite (e.g. "inf", "nan" or overflowing digits).
+    """
+    # isdigit() alone also accepts characters such as '²' that int() rejects
+    if retry_after.isascii() and retry_after.isdecimal():
+        try:
+            seconds = float(int(retry_after))
+        except (OverflowError, ValueError):
+            # Too large for a float, or beyond int()'s digit limit
+            seconds = math.inf
+    else:
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            seconds = None
+    
+    if seconds is not None:
+        if not math.isfinite(seconds):
+            logger.warning("Invalid Retry-After header: %s", retry_after)
+            return None
+        return max(0.0, seconds)
+    
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        logger.warning("Invalid Retry-After header: %s", retry_after)
+        return None
+    
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
 
 class RetryConfig:
     """Configuration for retry behavior."""
@@ -36,13 +78,19 @@ class RetryConfig:
         self.max_delay = max_delay
         self.exponential_factor = exponential_factor
         self.jitter = jitter
+        # Private RNG for jitter rather than the module-level random functions
+        self._rng = random.Random()
+        
+        # Backoff table cache, rebuilt by _delays when the settings change
+        self._delays_key: Optional[Tuple[int, float, float, float]] = None
+        self._delays_table: Tuple[float, ...] = ()
         
         self.retryable_exceptions = retryable_exceptions or {
             CursorNetworkError,
             CursorServerError,
             CursorTimeoutError,
-            aiohttp.ClientConnectorError,
-            aiohttp.ClientTimeout,
+            aiohttp.ClientConnectionError,
+            aiohttp.ServerTimeoutError,
             asyncio.TimeoutError,
         }
         
@@ -50,6 +98,32 @@ class RetryConfig:
             500, 502, 503, 504,  # Server errors
             429,  # Rate limiting (handled specially)
         }
+    
+    @property
+    def _retryable_exc_tuple(self) -> Tuple[Type[Exception], ...]:
+        """Current retryable exception types as a tuple for one isinstance() call.
+        
+        Built from retryable_exceptions on each access, so types added to the
+        set after construction are honored.
+        """
+        return tuple(self.retryable_exceptions)
+    
+    @property
+    def _delays(self) -> Tuple[float, ...]:
+        """Exponential backoff per attempt, capped at max_delay.
+        
+        The table is precomputed from the current settings and rebuilt if
+        max_attempts, base_delay, max_delay or exponential_factor change.
+        """
+        key = (self.max_attempts, self.base_delay, self.max_delay, self.exponential_factor)
+        if key != self._delays_key:
+            # base_delay * (exponential_factor ^ attempt), capped at max_delay
+            self._delays_table = tuple(
+                min(self.base_delay * (self.exponential_factor ** attempt), self.max_delay)
+                for attempt in range(self.max_attempts)
+            )
+            self._delays_key = key
+        return self._delays_table
 
 
 class RetryHandler:
@@ -57,29 +131,27 @@ class RetryHandler:
     
     def __init__(self, config: Optional[RetryConfig] = None):
         self.config = config or RetryConfig()
+        # (deadline in loop time, event set at the deadline) of the latest rate-limit wait
+        self._rate_limit_gate: Optional[Tuple[float, asyncio.Event]] = None
     
     def _calculate_delay(self, attempt: int, rate_limit_delay: Optional[float] = None) -> float:
         """Calculate delay for next retry attempt."""
         if rate_limit_delay is not None:
-            # For rate limiting, respect the Retry-After header
-            return rate_limit_delay
+            # For rate limiting, respect the Retry-After header, capped at max_delay
+            return min(rate_limit_delay, self.config.max_delay)
         
-        # Exponential backoff: base_delay * (exponential_factor ^ attempt)
-        delay = self.config.base_delay * (self.config.exponential_factor ** attempt)
+        # Precomputed exponential backoff
+        delay = self.config._delays[attempt]
         
-        # Cap at max_delay
-        delay = min(delay, self.config.max_delay)
-        
-        # Add jitter to prevent thundering herd
+        # Add +/-10% jitter to prevent thundering herd
         if self.config.jitter:
-            jitter_range = delay * 0.1  # 10% jitter
-            delay += random.uniform(-jitter_range, jitter_range)
+            delay *= 1.0 + (self.config._rng.random() - 0.5) * 0.2
         
-        return max(0, delay)
+        return delay if delay > 0 else 0.0
     
     def _is_retryable_exception(self, exception: Exception) -> bool:
         """Check if an exception should trigger a retry."""
-        return any(isinstance(exception, exc_type) for exc_type in self.config.retryable_exceptions)
+        return isinstance(exception, self.config._retryable_exc_tuple)
     
     def _is_retryable_status_code(self, status_code: int) -> bool:
         """Check if a status code should trigger a retry."""
@@ -94,13 +166,26 @@ class RetryHandler:
         if not retry_after:
             return None
         
-        try:
-            # Retry-After can be in seconds or HTTP-date format
-            # For simplicity, we'll assume it's always in seconds
-            return float(retry_after)
-        except ValueError:
-            logger.warning(f"Invalid Retry-After header: {retry_after}")
-            return None
+        return parse_retry_after(retry_after)
+    
+    async def _wait_for_rate_limit(self, delay: float) -> None:
+        """Sleep for a rate-limit delay, sharing one timer between callers.
+        
+        Concurrent calls rate limited with (nearly) the same deadline wait on
+        a single event set by one loop.call_later timer, instead of each
+        scheduling its own sleep.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + delay
+        
+        gate = self._rate_limit_gate
+        if gate is None or gate[1].is_set() or abs(gate[0] - deadline) > _RATE_LIMIT_GATE_TOLERANCE:
+            event = asyncio.Event()
+            loop.call_later(delay, event.set)
+            gate = (deadline, event)
+            self._rate_limit_gate = gate
+        
+        await gate[1].wait()
     
     async def execute_with_retry(
         self,
@@ -125,11 +210,11 @@ class RetryHandler:
                 delay = self._calculate_delay(attempt, e.retry_after)
                 
                 logger.warning(
-                    f"Rate limited, retrying in {delay:.2f}s "
-                    f"(attempt {attempt + 1}/{self.config.max_attempts})"
+                    "Rate limited, retrying in %.2fs (attempt %d/%d)",
+                    delay, attempt + 1, self.config.max_attempts
                 )
                 
-                await asyncio.sleep(delay)
+                await self._wait_for_rate_limit(delay)
                 continue
                 
             except Exception as e:
@@ -146,9 +231,8 @@ class RetryHandler:
                 delay = self._calculate_delay(attempt)
                 
                 logger.warning(
-                    f"Request failed ({type(e).__name__}: {e}), "
-                    f"retrying in {delay:.2f}s "
-                    f"(attempt {attempt + 1}/{self.config.max_attempts})"
+                    "Request failed (%s: %s), retrying in %.2fs (attempt %d/%d)",
+                    type(e).__name__, e, delay, attempt + 1, self.config.max_attempts
                 )
                 
                 await asyncio.sleep(delay)
@@ -157,9 +241,8 @@ class RetryHandler:
         # All retries exhausted
         raise CursorRetryExhaustedError(
             f"All {self.config.max_attempts} retry attempts exhausted",
-            attempts=self.config.max_attempts,
-            last_exception=last_exception
-        )
+            attempts=self.config.max_attempts
+        ) from last_exception
 
 
 def with_retry(config: Optional[RetryConfig] = None):
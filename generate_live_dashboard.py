@@ -39,11 +39,20 @@ Available groups: ai_champs, engineering, management, qa, backend, frontend, dev
 
 import argparse
 import asyncio
-import json
+import hashlib
+import heapq
+import io
+import logging
 import os
 import sys
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Tuple
+from operator import add, attrgetter, itemgetter
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, TextIO, Tuple
+from pydantic_core import from_json, to_json
 from cursor_admin_sdk import (
     CursorAdminClient,
     CursorAuthError,
@@ -113,23 +122,418 @@ PREDEFINED_GROUPS = {
     ]
 }
 
+# Shared read-only stand-in for a week without stats (e.g. when a fetch fails)
+_EMPTY_WEEK_STATS = MappingProxyType({
+    'lines_of_agent_edits': 0,
+    'total_requests': 0,
+    'total_tabs_accepted': 0
+})
+
+# Per-user stats that are summed as-is into group totals
+_SUMMED_STAT_KEYS = (
+    'agent_requests',
+    'composer_requests',
+    'total_requests',
+    'total_tabs_accepted',
+    'lines_of_agent_edits',
+    'accepted_lines_added',
+    'accepted_lines_deleted',
+    'lines_added',
+    'lines_deleted',
+)
+
+# Per-day series kept in each user's columnar daily breakdown (alongside 'date')
+_DAILY_SERIES_KEYS = ('total_chats', 'total_tabs_accepted', 'lines_of_agent_edits')
+
+# (lines, chats, completions) for a day missing from a user's daily breakdown
+_NO_DAILY_ACTIVITY = (0, 0, 0)
+
+# Directory for cached dashboard analytics responses
+ANALYTICS_CACHE_DIR = ".cursor_analytics_cache"
+
+# Seconds a cached response that covers recent days stays fresh
+LIVE_ANALYTICS_TTL = 300
+
+# Finished days before today that are still refetched like today, since the
+# server can report late-arriving data for them
+ANALYTICS_SETTLE_DAYS = 2
+
+# Seconds after which cached analytics files are pruned; settled days are
+# cached per day and reused while a report window still covers them
+ANALYTICS_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+
+class AnalyticsDiskCache:
+    """JSON file cache for dashboard analytics responses.
+    
+    Each entry is stored in its own file named after a hash of the key.
+    Entries read without a TTL do not expire, which suits settled days
+    whose metrics no longer change; prune() removes files once they are
+    older than ANALYTICS_CACHE_MAX_AGE.
+    """
+    
+    def __init__(self, directory: str = ANALYTICS_CACHE_DIR):
+        self.directory = directory
+    
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+    
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[DashboardAnalyticsResponse]:
+        """Return the cached response for key, or None if missing or stale."""
+        path = self._path(key)
+        try:
+            if ttl is not None and time.time() - os.path.getmtime(path) > ttl:
+                return None
+            with open(path, 'rb') as f:
+                return DashboardAnalyticsResponse.model_validate_json(f.read())
+        except (OSError, ValueError):
+            # Missing or unreadable entries are treated as cache misses
+            return None
+    
+    def set(self, key: str, analytics: DashboardAnalyticsResponse) -> None:
+        """Store a response under key, replacing any previous entry."""
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(analytics.model_dump_json(by_alias=True))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ Could not write analytics cache entry {path}: {e}")
+    
+    def prune(self, max_age: float = ANALYTICS_CACHE_MAX_AGE) -> int:
+        """Delete cache files last written more than max_age seconds ago.
+        
+        Returns:
+            Number of files removed
+        """
+        cutoff = time.time() - max_age
+        removed = 0
+        try:
+            entries = os.scandir(self.directory)
+        except OSError:
+            return 0
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(('.json', '.tmp')):
+                    continue
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                        removed += 1
+                except OSError:
+                    continue
+        return removed
+
+
+logger = logging.getLogger(__name__)
+
+
+def _print_lines(lines: List[str]) -> None:
+    """Print buffered progress lines with a single write."""
+    if lines:
+        print("\n".join(lines))
+
+
+# Rank badge class and label for the top three leaderboard places
+_LEADERBOARD_RANKS = {1: ('gold', '🥇'), 2: ('silver', '🥈'), 3: ('bronze', '🥉')}
+
+
+def _render_leaderboard(title: str, emoji: str, entries: List[Tuple[str, int]]) -> str:
+    """Render one report leaderboard from ranked (user name, value) entries."""
+    rows = []
+    for i, (user_name, value) in enumerate(entries, 1):
+        rank_class, trophy_emoji = _LEADERBOARD_RANKS.get(i, ('', i))
+        rows.append(f"""
+                    <div class="leaderboard-item">
+                        <div class="rank {rank_class}">{trophy_emoji}</div>
+                        <div class="user-info">
+                            <div class="user-name">{user_name}</div>
+                        </div>
+                        <div class="user-value">{value:,}</div>
+                    </div>""")
+    return f"""
+                <div class="leaderboard">
+                    <h3><span class="trophy">{emoji}</span>{title}</h3>{''.join(rows)}
+                </div>"""
+
+
+# Static head of the Chart.js report (styles and page header), shared by every render
+_REPORT_HTML_HEAD = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Cursor Analytics Dashboard</title>
+    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            max-width: 1400px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 10px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            overflow: hidden;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            text-align: center;
+        }
+        .header h1 {
+            margin: 0;
+            font-size: 2.5em;
+            font-weight: 300;
+        }
+        .header p {
+            margin: 10px 0 0 0;
+            opacity: 0.9;
+            font-size: 1.1em;
+        }
+        .summary {
+            padding: 30px;
+            background: #f8f9fa;
+            border-bottom: 1px solid #e9ecef;
+        }
+        .summary h2 {
+            margin: 0 0 20px 0;
+            color: #495057;
+        }
+        .summary-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+        }
+        .summary-card {
+            background: white;
+            padding: 20px;
+            border-radius: 8px;
+            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+            text-align: center;
+        }
+        .summary-card h3 {
+            margin: 0 0 10px 0;
+            color: #6c757d;
+            font-size: 0.9em;
+            font-weight: 500;
+            text-transform: uppercase;
+        }
+        .summary-card .value {
+            font-size: 2em;
+            font-weight: bold;
+            color: #495057;
+        }
+        .charts-container {
+            padding: 30px;
+        }
+        .chart-section {
+            margin-bottom: 50px;
+        }
+        .chart-section h2 {
+            margin: 0 0 20px 0;
+            color: #495057;
+            text-align: center;
+            font-size: 1.8em;
+        }
+        .chart-container {
+            position: relative;
+            height: 400px;
+            margin: 20px 0;
+        }
+        .legend {
+            margin-top: 20px;
+            display: flex;
+            flex-wrap: wrap;
+            justify-content: center;
+            gap: 15px;
+        }
+        .legend-item {
+            display: flex;
+            align-items: center;
+            gap: 8px;
+            padding: 5px 10px;
+            background: #f8f9fa;
+            border-radius: 15px;
+            font-size: 0.9em;
+        }
+        .legend-color {
+            width: 12px;
+            height: 12px;
+            border-radius: 50%;
+        }
+        .date-range {
+            text-align: center;
+            color: #6c757d;
+            font-style: italic;
+            margin-bottom: 30px;
+        }
+        .leaderboards {
+            padding: 30px;
+            background: #f8f9fa;
+            border-bottom: 1px solid #e9ecef;
+        }
+        .leaderboards h2 {
+            margin: 0 0 30px 0;
+            color: #495057;
+            text-align: center;
+            font-size: 1.8em;
+        }
+        .leaderboard-grid {
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 30px;
+        }
+        .leaderboard {
+            background: white;
+            border-radius: 12px;
+            padding: 25px;
+            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
+        }
+        .leaderboard h3 {
+            margin: 0 0 20px 0;
+            color: #495057;
+            text-align: center;
+            font-size: 1.3em;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            gap: 8px;
+        }
+        .leaderboard-item {
+            display: flex;
+            align-items: center;
+            padding: 12px 0;
+            border-bottom: 1px solid #f0f0f0;
+        }
+        .leaderboard-item:last-child {
+            border-bottom: none;
+        }
+        .rank {
+            font-size: 1.2em;
+            font-weight: bold;
+            width: 30px;
+            text-align: center;
+            color: #6c757d;
+        }
+        .rank.gold { color: #ffd700; }
+        .rank.silver { color: #c0c0c0; }
+        .rank.bronze { color: #cd7f32; }
+        .user-info {
+            flex: 1;
+            margin-left: 15px;
+        }
+        .user-name {
+            font-weight: 600;
+            color: #495057;
+            font-size: 1em;
+        }
+        .user-value {
+            font-size: 1.1em;
+            font-weight: bold;
+            text-align: right;
+            color: #28a745;
+        }
+        .trophy {
+            font-size: 1.5em;
+            margin-right: 5px;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>📊 Cursor Analytics Dashboard</h1>
+            <p>Daily User Activity Breakdown</p>
+        </div>"""
+
 
 class RequestAggregator:
     """Aggregates agent and composer requests from dashboard analytics."""
     
-    def __init__(self, cookie_string: str, email_to_userid_mapping: Dict[str, Tuple[int, int]] = None):
+    # Upper bound on dashboard requests in flight at once
+    MAX_CONCURRENT_REQUESTS = 10
+    
+    def __init__(
+        self,
+        cookie_string: str,
+        email_to_userid_mapping: Dict[str, Tuple[int, int]] = None,
+        cache_dir: Optional[str] = ANALYTICS_CACHE_DIR
+    ):
         """Initialize the aggregator with authentication cookie.
         
         Args:
             cookie_string: Cookie string from authenticated browser session
             email_to_userid_mapping: Optional dict mapping emails to (team_id, user_id) tuples
+            cache_dir: Directory for cached analytics responses, or None to disable caching
         """
         self.cookie_string = cookie_string
         # API key is required for client initialization but won't be used for dashboard API
         self.api_key = "not_used_for_dashboard_api"
         self.email_to_userid_mapping = email_to_userid_mapping or {}
+        self._analytics_cache = AnalyticsDiskCache(cache_dir) if cache_dir else None
+        if self._analytics_cache is not None:
+            self._analytics_cache.prune()
         self._team_members_cache = None
         self._team_spend_cache = None
+        self._request_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+        self._client = None
+        # Pending per-user aggregations, keyed by (team_id, user_id, start_date, end_date)
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        # Finished per-user aggregations as (monotonic time, stats), keyed by
+        # (team_id, user_id, start day, end day) and kept in insertion-time order
+        self._stats_memo: Dict[tuple, Tuple[float, Dict[str, Any]]] = {}
+    
+    async def __aenter__(self) -> "RequestAggregator":
+        """Open one client that is reused by every request until exit."""
+        client = CursorAdminClient(api_key=self.api_key)
+        await client.__aenter__()
+        self._client = client
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the client opened by __aenter__."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.__aexit__(exc_type, exc_val, exc_tb)
+    
+    @asynccontextmanager
+    async def _client_session(self):
+        """Yield the long-lived client, or a short-lived one outside ``async with``."""
+        if self._client is not None:
+            yield self._client
+        else:
+            async with CursorAdminClient(api_key=self.api_key) as client:
+                yield client
+    
+    async def fetch_user_stats_bounded(
+        self,
+        team_id: int,
+        user_id: int,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict[str, any]:
+        """Aggregate a single user's stats while holding a concurrency slot.
+        
+        Bounds how many dashboard requests run at once when callers fan out
+        over many users with asyncio.gather. Errors propagate to the caller.
+        """
+        async with self._request_semaphore:
+            return await self.aggregate_requests_for_user(
+                team_id=team_id,
+                user_id=user_id,
+                start_date=start_date,
+                end_date=end_date
+            )
     
     async def aggregate_requests_for_user(
         self, 
@@ -149,16 +553,166 @@ class RequestAggregator:
         Returns:
             Dictionary with aggregated request counts
         """
-        async with CursorAdminClient(api_key=self.api_key) as client:
-            analytics = await client.get_dashboard_analytics(
+        # Reuse a recent result for the same user and days, e.g. when a
+        # report revisits a user it already aggregated
+        memo_key = (team_id, user_id, start_date.date(), end_date.date())
+        memo = self._stats_memo.get(memo_key)
+        if memo is not None:
+            if time.monotonic() - memo[0] <= LIVE_ANALYTICS_TTL:
+                return memo[1]
+            del self._stats_memo[memo_key]
+        
+        # Concurrent callers asking for the same user and range share one fetch
+        key = (team_id, user_id, start_date, end_date)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load_user_stats(team_id, user_id, start_date, end_date))
+            self._inflight[key] = task
+            
+            def _on_done(done: asyncio.Task) -> None:
+                self._inflight.pop(key, None)
+                if not done.cancelled() and done.exception() is None:
+                    self._remember_stats(memo_key, done.result())
+            
+            task.add_done_callback(_on_done)
+        
+        # Shield so one caller being cancelled does not cancel the shared fetch
+        return await asyncio.shield(task)
+    
+    def _remember_stats(self, memo_key: tuple, stats: Dict[str, Any]) -> None:
+        """Memoize a finished aggregation and evict entries past LIVE_ANALYTICS_TTL."""
+        now = time.monotonic()
+        memo = self._stats_memo
+        # Re-insert so the dict stays ordered by store time, oldest first
+        memo.pop(memo_key, None)
+        memo[memo_key] = (now, stats)
+        while True:
+            oldest_key = next(iter(memo))
+            if now - memo[oldest_key][0] <= LIVE_ANALYTICS_TTL:
+                break
+            del memo[oldest_key]
+    
+    async def _load_user_stats(
+        self,
+        team_id: int,
+        user_id: int,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict[str, any]:
+        """Fetch analytics for a single user and aggregate them."""
+        if self._analytics_cache is None:
+            analytics = await self._fetch_analytics(team_id, user_id, start_date, end_date)
+        else:
+            analytics = await self._fetch_analytics_cached(team_id, user_id, start_date, end_date)
+        
+        return self._aggregate_analytics(analytics)
+    
+    async def _fetch_analytics(
+        self,
+        team_id: int,
+        user_id: int,
+        start_date: datetime,
+        end_date: datetime
+    ) -> DashboardAnalyticsResponse:
+        """Fetch dashboard analytics for one user from the API."""
+        async with self._client_session() as client:
+            return await client.get_dashboard_analytics(
                 cookie_string=self.cookie_string,
                 team_id=team_id,
                 user_id=user_id,
                 start_date=start_date,
                 end_date=end_date
             )
+    
+    async def _cached_analytics(
+        self,
+        team_id: int,
+        user_id: int,
+        start_date: datetime,
+        end_date: datetime,
+        ttl: Optional[float]
+    ) -> DashboardAnalyticsResponse:
+        """Return analytics for the range from the disk cache, fetching on a miss."""
+        key = f"{team_id}:{user_id}:{start_date.date()}:{end_date.date()}"
+        analytics = self._analytics_cache.get(key, ttl)
+        if analytics is None:
+            analytics = await self._fetch_analytics(team_id, user_id, start_date, end_date)
+            self._analytics_cache.set(key, analytics)
+        return analytics
+    
+    async def _settled_analytics(
+        self,
+        team_id: int,
+        user_id: int,
+        start_date: datetime,
+        end_date: datetime
+    ) -> DashboardAnalyticsResponse:
+        """Return analytics for settled days, cached one calendar day per entry.
         
-        return self._aggregate_analytics(analytics)
+        Only the days missing from the cache are fetched, as one request for
+        the whole days they span, so reports whose window moves forward each
+        day keep reusing the days they already have.
+        """
+        tz = start_date.tzinfo
+        first_day = start_date.date()
+        days = [first_day + timedelta(days=n) for n in range((end_date.date() - first_day).days + 1)]
+        keys = {day: f"{team_id}:{user_id}:{day}" for day in days}
+        entries = {day: self._analytics_cache.get(keys[day]) for day in days}
+        
+        missing = [day for day in days if entries[day] is None]
+        if missing:
+            fetch_start = datetime.combine(missing[0], datetime.min.time(), tzinfo=tz)
+            fetch_end = datetime.combine(missing[-1] + timedelta(days=1), datetime.min.time(), tzinfo=tz) - timedelta(milliseconds=1)
+            analytics = await self._fetch_analytics(team_id, user_id, fetch_start, fetch_end)
+            
+            metrics_by_day: Dict[Any, List[Any]] = {}
+            for metric in analytics.daily_metrics:
+                timestamp = metric.timestamp.astimezone(tz) if tz else metric.timestamp
+                metrics_by_day.setdefault(timestamp.date(), []).append(metric)
+            
+            # Store every fetched day, including days without any metrics
+            for day in days[days.index(missing[0]):days.index(missing[-1]) + 1]:
+                entry = analytics.model_copy(update={'daily_metrics': metrics_by_day.get(day, [])})
+                self._analytics_cache.set(keys[day], entry)
+                entries[day] = entry
+        
+        return entries[days[-1]].model_copy(update={
+            'daily_metrics': [metric for day in days for metric in entries[day].daily_metrics]
+        })
+    
+    async def _fetch_analytics_cached(
+        self,
+        team_id: int,
+        user_id: int,
+        start_date: datetime,
+        end_date: datetime
+    ) -> DashboardAnalyticsResponse:
+        """Fetch analytics, serving settled days from the disk cache.
+        
+        The range is split ANALYTICS_SETTLE_DAYS before the start of today.
+        Earlier days are cached one calendar day per entry until pruned, while
+        the recent slice (today and the last few finished days, which can
+        still receive late data) expires after LIVE_ANALYTICS_TTL, so a rerun
+        only goes to the network for data that can still change or that has
+        not been cached yet.
+        """
+        settled_before = datetime.now(start_date.tzinfo).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        ) - timedelta(days=ANALYTICS_SETTLE_DAYS)
+        if end_date < settled_before:
+            return await self._settled_analytics(team_id, user_id, start_date, end_date)
+        if start_date >= settled_before:
+            return await self._cached_analytics(team_id, user_id, start_date, end_date, LIVE_ANALYTICS_TTL)
+        
+        history, live = await asyncio.gather(
+            self._settled_analytics(team_id, user_id, start_date, settled_before - timedelta(milliseconds=1)),
+            self._cached_analytics(team_id, user_id, settled_before, end_date, LIVE_ANALYTICS_TTL)
+        )
+        
+        # Merge by day; a day reported by both slices keeps the live figures
+        merged = {metric.date: metric for metric in history.daily_metrics}
+        merged.update((metric.date, metric) for metric in live.daily_metrics)
+        return live.model_copy(update={'daily_metrics': list(merged.values())})
     
     def _aggregate_analytics(self, analytics: DashboardAnalyticsResponse) -> Dict[str, any]:
         """Aggregate requests from analytics response.
@@ -167,69 +721,46 @@ class RequestAggregator:
             analytics: Dashboard analytics response
             
         Returns:
-            Dictionary with aggregated counts and daily breakdown
+            Dictionary with aggregated counts and daily breakdown. The daily
+            breakdown is columnar: one list per field, indexed by day.
         """
-        total_agent_requests = 0
-        total_composer_requests = 0
-        total_combined_requests = 0
-        total_lines_of_agent_edits = 0
-        total_tabs_accepted = 0
-        
-        # Line statistics
-        total_accepted_lines_added = 0
-        total_accepted_lines_deleted = 0
-        total_lines_added = 0
-        total_lines_deleted = 0
-        
-        # Daily breakdown for charts
-        daily_breakdown = []
-        
-        for metric in analytics.daily_metrics:
-            agent_reqs = metric.agent_requests or 0
-            composer_reqs = metric.composer_requests or 0
-            
-            total_agent_requests += agent_reqs
-            total_composer_requests += composer_reqs
-            total_combined_requests += (agent_reqs + composer_reqs)
-            
-            # Aggregate tab completions
-            total_tabs_accepted += metric.total_tabs_accepted or 0
-            
-            # Aggregate line statistics
-            accepted_lines_added = metric.accepted_lines_added or 0
-            accepted_lines_deleted = metric.accepted_lines_deleted or 0
-            lines_added = metric.lines_added or 0
-            lines_deleted = metric.lines_deleted or 0
-            
-            total_accepted_lines_added += accepted_lines_added
-            total_accepted_lines_deleted += accepted_lines_deleted
-            total_lines_added += lines_added
-            total_lines_deleted += lines_deleted
-            
-            # Calculate Lines of Agent Edits (all line changes)
-            daily_lines_edited = accepted_lines_added + accepted_lines_deleted + lines_added + lines_deleted
-            total_lines_of_agent_edits += daily_lines_edited
-            
-            # Store daily breakdown for charts
-            daily_breakdown.append({
-                'date': metric.timestamp.strftime('%Y-%m-%d'),
-                'total_chats': agent_reqs + composer_reqs,
-                'total_tabs_accepted': metric.total_tabs_accepted or 0,
-                'lines_of_agent_edits': daily_lines_edited
-            })
+        metrics = analytics.daily_metrics
+        
+        # Pull each field into its own column once, then reduce column-wise
+        agent_reqs = [metric.agent_requests or 0 for metric in metrics]
+        composer_reqs = [metric.composer_requests or 0 for metric in metrics]
+        tabs_accepted = [metric.total_tabs_accepted or 0 for metric in metrics]
+        accepted_lines_added = [metric.accepted_lines_added or 0 for metric in metrics]
+        accepted_lines_deleted = [metric.accepted_lines_deleted or 0 for metric in metrics]
+        lines_added = [metric.lines_added or 0 for metric in metrics]
+        lines_deleted = [metric.lines_deleted or 0 for metric in metrics]
+        
+        daily_chats = list(map(add, agent_reqs, composer_reqs))
+        # Lines of Agent Edits (all line changes) per day
+        daily_lines_edited = [
+            sum(day) for day in zip(accepted_lines_added, accepted_lines_deleted, lines_added, lines_deleted)
+        ]
+        
+        # Daily breakdown for charts, as parallel per-field columns
+        daily_breakdown = {
+            'date': [metric.timestamp.strftime('%Y-%m-%d') for metric in metrics],
+            'total_chats': daily_chats,
+            'total_tabs_accepted': tabs_accepted,
+            'lines_of_agent_edits': daily_lines_edited
+        }
         
         return {
-            'agent_requests': total_agent_requests,
-            'composer_requests': total_composer_requests,
-            'total_requests': total_combined_requests,
-            'total_tabs_accepted': total_tabs_accepted,
-            'lines_of_agent_edits': total_lines_of_agent_edits,
-            'accepted_lines_added': total_accepted_lines_added,
-            'accepted_lines_deleted': total_accepted_lines_deleted,
-            'lines_added': total_lines_added,
-            'lines_deleted': total_lines_deleted,
-            'days_analyzed': len(analytics.daily_metrics),
-            'active_days': sum(1 for m in analytics.daily_metrics if (m.agent_requests or 0) + (m.composer_requests or 0) > 0),
+            'agent_requests': sum(agent_reqs),
+            'composer_requests': sum(composer_reqs),
+            'total_requests': sum(daily_chats),
+            'total_tabs_accepted': sum(tabs_accepted),
+            'lines_of_agent_edits': sum(daily_lines_edited),
+            'accepted_lines_added': sum(accepted_lines_added),
+            'accepted_lines_deleted': sum(accepted_lines_deleted),
+            'lines_added': sum(lines_added),
+            'lines_deleted': sum(lines_deleted),
+            'days_analyzed': len(metrics),
+            'active_days': sum(1 for chats in daily_chats if chats > 0),
             'daily_breakdown': daily_breakdown
         }
     
@@ -252,56 +783,56 @@ class RequestAggregator:
             Dictionary with group aggregation results
         """
         group_totals = {
-            'agent_requests': 0,
-            'composer_requests': 0,
-            'total_requests': 0,
-            'total_tabs_accepted': 0,
-            'lines_of_agent_edits': 0,
-            'accepted_lines_added': 0,
-            'accepted_lines_deleted': 0,
-            'lines_added': 0,
-            'lines_deleted': 0,
+            **dict.fromkeys(_SUMMED_STAT_KEYS, 0),
             'total_active_days': 0,
             'members_analyzed': 0,
+            'inactive_members': 0,
             'per_member_stats': []
         }
         
         print(f"\n📊 Aggregating requests for {group_name} ({len(group_members)} members)")
         print(f"Period: {start_date.date()} to {end_date.date()}\n")
         
-        for team_id, user_id in group_members:
+        async def _fetch_member_at(index: int) -> Tuple[int, Any]:
+            team_id, user_id = group_members[index]
             try:
-                user_stats = await self.aggregate_requests_for_user(
-                    team_id=team_id,
-                    user_id=user_id,
-                    start_date=start_date,
-                    end_date=end_date
-                )
-                
-                # Add to group totals
-                group_totals['agent_requests'] += user_stats['agent_requests']
-                group_totals['composer_requests'] += user_stats['composer_requests']
-                group_totals['total_requests'] += user_stats['total_requests']
-                group_totals['total_tabs_accepted'] += user_stats['total_tabs_accepted']
-                group_totals['lines_of_agent_edits'] += user_stats['lines_of_agent_edits']
-                group_totals['accepted_lines_added'] += user_stats['accepted_lines_added']
-                group_totals['accepted_lines_deleted'] += user_stats['accepted_lines_deleted']
-                group_totals['lines_added'] += user_stats['lines_added']
-                group_totals['lines_deleted'] += user_stats['lines_deleted']
-                group_totals['total_active_days'] += user_stats['active_days']
-                group_totals['members_analyzed'] += 1
-                
-                # Store per-member stats
+                return index, await self.fetch_user_stats_bounded(team_id, user_id, start_date, end_date)
+            except Exception as e:
+                return index, e
+        
+        # Fetch every member at once (bounded by the request semaphore) and add
+        # to the group totals as each one lands, so summing overlaps with the
+        # requests still in flight
+        results = [None] * len(group_members)
+        for next_member in asyncio.as_completed([_fetch_member_at(index) for index in range(len(group_members))]):
+            index, user_stats = await next_member
+            results[index] = user_stats
+            if isinstance(user_stats, Exception):
+                continue
+            for key in _SUMMED_STAT_KEYS:
+                group_totals[key] += user_stats[key]
+            group_totals['total_active_days'] += user_stats['active_days']
+            group_totals['members_analyzed'] += 1
+        
+        # Report and keep per-member stats in group order
+        progress = []
+        for (team_id, user_id), user_stats in zip(group_members, results):
+            if isinstance(user_stats, Exception):
+                progress.append(f"  ✗ Error processing user {user_id} (Team {team_id}): {user_stats}")
+                continue
+            
+            # Store per-member stats; members with no activity are only counted
+            if user_stats['total_requests'] == 0 and user_stats['total_tabs_accepted'] == 0 and user_stats['lines_of_agent_edits'] == 0:
+                group_totals['inactive_members'] += 1
+            else:
                 group_totals['per_member_stats'].append({
                     'team_id': team_id,
                     'user_id': user_id,
                     **user_stats
                 })
-                
-                print(f"  ✓ User {user_id} (Team {team_id}): {user_stats['total_requests']:,} total requests, {user_stats['lines_of_agent_edits']:,} lines edited")
-                
-            except Exception as e:
-                print(f"  ✗ Error processing user {user_id} (Team {team_id}): {e}")
+            
+            progress.append(f"  ✓ User {user_id} (Team {team_id}): {user_stats['total_requests']:,} total requests, {user_stats['lines_of_agent_edits']:,} lines edited")
+        _print_lines(progress)
         
         # Calculate averages
         if group_totals['members_analyzed'] > 0:
@@ -325,13 +856,10 @@ class RequestAggregator:
             "user2@example.com": [1234567, 123456789]
         }
         """
-        import json
-        import os
-        
-        if os.path.exists(mapping_file):
+        path = Path(mapping_file)
+        if path.exists():
             try:
-                with open(mapping_file, 'r') as f:
-                    raw_mapping = json.load(f)
+                raw_mapping = from_json(path.read_bytes())
                 
                 # Convert lists to tuples
                 self.email_to_userid_mapping = {
@@ -348,15 +876,12 @@ class RequestAggregator:
     
     def save_email_mapping_to_file(self, mapping_file: str = "email_mapping.json"):
         """Save current email to userID mapping to a JSON file."""
-        import json
-        
         # Convert tuples to lists for JSON serialization
         raw_mapping = {
             email: list(ids) for email, ids in self.email_to_userid_mapping.items()
         }
         
-        with open(mapping_file, 'w') as f:
-            json.dump(raw_mapping, f, indent=2)
+        Path(mapping_file).write_bytes(to_json(raw_mapping, indent=2))
         
         print(f"💾 Saved email mappings for {len(self.email_to_userid_mapping)} users to {mapping_file}")
     
@@ -373,7 +898,7 @@ class RequestAggregator:
             bool: True if successful, False otherwise
         """
         try:
-            async with CursorAdminClient(api_key=self.api_key) as client:
+            async with self._client_session() as client:
                 # Fetch team spend data
                 spend_response = await client.get_team_spend(
                     cookie_string=self.cookie_string,
@@ -383,12 +908,13 @@ class RequestAggregator:
                 # Cache the response for later use
                 self._team_spend_cache = spend_response
                 
-                # Build email mappings
-                mapping_count = 0
-                for member in spend_response.team_member_spend:
-                    self.email_to_userid_mapping[member.email] = (team_id, member.user_id)
-                    mapping_count += 1
-                
+                # Build email mappings in one bulk update
+                self.email_to_userid_mapping.update(
+                    (member.email, (team_id, member.user_id))
+                    for member in spend_response.team_member_spend
+                )
+                mapping_count = len(spend_response.team_member_spend)
+
                 print(f"✅ Loaded email mappings for {mapping_count} team members from team spend data")
                 print(f"📊 Team: {team_id} | Total members: {spend_response.total_members}")
                 
@@ -441,6 +967,27 @@ class RequestAggregator:
                 f"Add mapping using: aggregator.add_email_mapping('{email}', team_id, user_id)"
             )
     
+    def resolve_emails_bulk(self, emails: List[str]) -> Tuple[List[Tuple[str, int, int]], List[str]]:
+        """Resolve many emails to (team_id, user_id) in a single pass.
+        
+        Args:
+            emails: Email addresses to resolve
+            
+        Returns:
+            Tuple of (resolved, missing): (email, team_id, user_id) triples for
+            mapped emails in input order, and the emails with no mapping
+        """
+        mapping = self.email_to_userid_mapping
+        resolved = []
+        missing = []
+        for email in emails:
+            ids = mapping.get(email)
+            if ids is None:
+                missing.append(email)
+            else:
+                resolved.append((email, *ids))
+        return resolved, missing
+    
     async def aggregate_requests_for_email(
         self,
         email: str,
@@ -481,38 +1028,40 @@ class RequestAggregator:
         print(f"\n📊 Generating daily breakdown data from emails...")
         print(f"Period: {start_date.date()} to {end_date.date()}\n")
         
-        for email in emails:
-            try:
-                team_id, user_id = self.resolve_email_to_userid(email)
-                
-                user_stats = await self.aggregate_requests_for_user(
-                    team_id=team_id,
-                    user_id=user_id,
-                    start_date=start_date,
-                    end_date=end_date
-                )
-                
-                # Use email as display name (remove domain for cleaner display)
-                display_name = email.split('@')[0] if '@' in email else email
-                
-                all_users_data[display_name] = {
-                    'team_id': team_id,
-                    'user_id': user_id,
-                    'email': email,
-                    'daily_breakdown': user_stats['daily_breakdown'],
-                    'totals': {
-                        'total_chats': user_stats['total_requests'],
-                        'total_tabs_accepted': user_stats['total_tabs_accepted'],
-                        'lines_of_agent_edits': user_stats['lines_of_agent_edits']
-                    }
+        # Resolve every email up front so only known users are fetched
+        resolved, missing = self.resolve_emails_bulk(emails)
+        _print_lines([f"  ✗ Error resolving {email}: not found in email mapping" for email in missing])
+        
+        # Fetch all users concurrently, then fold the results in input order
+        results = await asyncio.gather(
+            *(self.fetch_user_stats_bounded(team_id, user_id, start_date, end_date)
+              for _, team_id, user_id in resolved),
+            return_exceptions=True
+        )
+        
+        progress = []
+        for (email, team_id, user_id), user_stats in zip(resolved, results):
+            if isinstance(user_stats, Exception):
+                progress.append(f"  ✗ Error processing {email}: {user_stats}")
+                continue
+            
+            # Use email as display name (remove domain for cleaner display)
+            display_name = email.split('@')[0] if '@' in email else email
+            
+            all_users_data[display_name] = {
+                'team_id': team_id,
+                'user_id': user_id,
+                'email': email,
+                'daily_breakdown': user_stats['daily_breakdown'],
+                'totals': {
+                    'total_chats': user_stats['total_requests'],
+                    'total_tabs_accepted': user_stats['total_tabs_accepted'],
+                    'lines_of_agent_edits': user_stats['lines_of_agent_edits']
                 }
-                
-                print(f"  ✓ {email}: {len(user_stats['daily_breakdown'])} days of data")
-                
-            except ValueError as e:
-                print(f"  ✗ Error resolving {email}: {e}")
-            except Exception as e:
-                print(f"  ✗ Error processing {email}: {e}")
+            }
+            
+            progress.append(f"  ✓ {email}: {user_stats['days_analyzed']} days of data")
+        _print_lines(progress)
         
         return all_users_data
     
@@ -534,22 +1083,32 @@ class RequestAggregator:
             return {}
         
         spend_data = self._team_spend_cache
-        members_with_spend = [m for m in spend_data.team_member_spend if m.spend_cents is not None]
-        members_with_requests = [m for m in spend_data.team_member_spend if m.fast_premium_requests is not None]
+        
+        # Count and total spend and requests in a single pass over the members
+        members_with_spend = []
+        total_spend_cents = 0
+        members_with_requests = 0
+        total_requests = 0
+        for m in spend_data.team_member_spend:
+            if m.spend_cents is not None:
+                members_with_spend.append(m)
+                total_spend_cents += m.spend_cents
+            if m.fast_premium_requests is not None:
+                members_with_requests += 1
+                total_requests += m.fast_premium_requests
         
         summary = {
             'total_members': spend_data.total_members,
             'subscription_cycle_start': spend_data.subscription_cycle_start,
             'members_with_spend_data': len(members_with_spend),
-            'members_with_request_data': len(members_with_requests)
+            'members_with_request_data': members_with_requests
         }
         
         if members_with_spend:
-            total_spend_cents = sum(m.spend_cents for m in members_with_spend if m.spend_cents)
             summary['total_team_spend_dollars'] = total_spend_cents / 100
             
             # Top 3 spenders
-            top_spenders = sorted(members_with_spend, key=lambda x: x.spend_cents or 0, reverse=True)[:3]
+            top_spenders = heapq.nlargest(3, members_with_spend, key=attrgetter('spend_cents'))
             summary['top_spenders'] = [
                 {
                     'email': m.email,
@@ -561,7 +1120,6 @@ class RequestAggregator:
             ]
         
         if members_with_requests:
-            total_requests = sum(m.fast_premium_requests for m in members_with_requests if m.fast_premium_requests)
             summary['total_fast_premium_requests'] = total_requests
         
         return summary
@@ -587,30 +1145,32 @@ class RequestAggregator:
         print(f"\n📊 Generating daily breakdown data...")
         print(f"Period: {start_date.date()} to {end_date.date()}\n")
         
-        for team_id, user_id, user_name in group_members:
-            try:
-                user_stats = await self.aggregate_requests_for_user(
-                    team_id=team_id,
-                    user_id=user_id,
-                    start_date=start_date,
-                    end_date=end_date
-                )
-                
-                all_users_data[user_name] = {
-                    'team_id': team_id,
-                    'user_id': user_id,
-                    'daily_breakdown': user_stats['daily_breakdown'],
-                    'totals': {
-                        'total_chats': user_stats['total_requests'],
-                        'total_tabs_accepted': user_stats['total_tabs_accepted'],
-                        'lines_of_agent_edits': user_stats['lines_of_agent_edits']
-                    }
+        # Fetch all users concurrently, then fold the results in input order
+        results = await asyncio.gather(
+            *(self.fetch_user_stats_bounded(team_id, user_id, start_date, end_date)
+              for team_id, user_id, _ in group_members),
+            return_exceptions=True
+        )
+        
+        progress = []
+        for (team_id, user_id, user_name), user_stats in zip(group_members, results):
+            if isinstance(user_stats, Exception):
+                progress.append(f"  ✗ Error processing {user_name}: {user_stats}")
+                continue
+            
+            all_users_data[user_name] = {
+                'team_id': team_id,
+                'user_id': user_id,
+                'daily_breakdown': user_stats['daily_breakdown'],
+                'totals': {
+                    'total_chats': user_stats['total_requests'],
+                    'total_tabs_accepted': user_stats['total_tabs_accepted'],
+                    'lines_of_agent_edits': user_stats['lines_of_agent_edits']
                 }
-                
-                print(f"  ✓ {user_name}: {len(user_stats['daily_breakdown'])} days of data")
-                
-            except Exception as e:
-                print(f"  ✗ Error processing {user_name}: {e}")
+            }
+            
+            progress.append(f"  ✓ {user_name}: {user_stats['days_analyzed']} days of data")
+        _print_lines(progress)
         
         return all_users_data
     
@@ -621,13 +1181,9 @@ class RequestAggregator:
             users_data: Data from generate_daily_charts_data
             output_file: Output HTML file name
         """
-        # Get all unique dates from all users
-        all_dates = set()
-        for user_data in users_data.values():
-            for day in user_data['daily_breakdown']:
-                all_dates.add(day['date'])
-        
-        sorted_dates = sorted(list(all_dates))
+        # Get all unique dates from all users in one union over their date columns
+        all_dates = set().union(*(user_data['daily_breakdown']['date'] for user_data in users_data.values()))
+        sorted_dates = sorted(all_dates)
         
         # Prepare data for charts
         chart_data = {
@@ -636,28 +1192,21 @@ class RequestAggregator:
             'metrics': ['total_chats', 'total_tabs_accepted', 'lines_of_agent_edits']
         }
         
+        # Position of each date in the shared axis, built once for all users
+        date_index = {date: i for i, date in enumerate(sorted_dates)}
+        
         for user_name, user_data in users_data.items():
-            chart_data['users'][user_name] = {
-                'total_chats': [],
-                'total_tabs_accepted': [],
-                'lines_of_agent_edits': [],
-                'totals': user_data['totals']
-            }
+            daily_breakdown = user_data['daily_breakdown']
+            positions = [date_index[date] for date in daily_breakdown['date']]
+            user_chart = chart_data['users'][user_name] = {}
             
-            # Create lookup for user's daily data
-            daily_lookup = {day['date']: day for day in user_data['daily_breakdown']}
-            
-            # Fill data for each date (0 if no data for that date)
-            for date in sorted_dates:
-                day_data = daily_lookup.get(date, {
-                    'total_chats': 0,
-                    'total_tabs_accepted': 0,
-                    'lines_of_agent_edits': 0
-                })
-                
-                chart_data['users'][user_name]['total_chats'].append(day_data['total_chats'])
-                chart_data['users'][user_name]['total_tabs_accepted'].append(day_data['total_tabs_accepted'])
-                chart_data['users'][user_name]['lines_of_agent_edits'].append(day_data['lines_of_agent_edits'])
+            # Scatter each column onto the shared dates (0 if no data for that date)
+            for key in _DAILY_SERIES_KEYS:
+                series = [0] * len(sorted_dates)
+                for position, value in zip(positions, daily_breakdown[key]):
+                    series[position] = value
+                user_chart[key] = series
+            user_chart['totals'] = user_data['totals']
         
         # Debug: Print chart data summary
         print(f"\n🔍 Chart Data Summary:")
@@ -671,18 +1220,25 @@ class RequestAggregator:
             print(f"    - Daily Tabs: {user_data['total_tabs_accepted']}")
             print(f"    - Daily Lines: {user_data['lines_of_agent_edits']}")
         
-        # Generate HTML content
-        html_content = self._generate_html_template(chart_data)
-        
-        # Write to file
-        # with open(output_file, 'w', encoding='utf-8') as f:
-        #     f.write(html_content)
+        # Stream the HTML straight to the output file
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            self._stream_html(chart_data, f)
         
         print(f"\n📊 HTML report generated: {output_file}")
         return output_file
     
     def _generate_html_template(self, chart_data: Dict[str, any]) -> str:
         """Generate HTML template with Chart.js visualizations."""
+        buffer = io.StringIO()
+        self._stream_html(chart_data, buffer)
+        return buffer.getvalue()
+    
+    def _stream_html(self, chart_data: Dict[str, any], fp: TextIO) -> None:
+        """Write the Chart.js report for chart_data to fp section by section.
+        
+        Writing straight to the output file keeps peak memory flat instead of
+        building the whole document as one string first.
+        """
         
         # Generate random colors for each user
         import random
@@ -694,217 +1250,33 @@ class RequestAggregator:
         ]
         
         user_colors = {}
+        # Static per-user dataset styling, shared by every chart
+        dataset_styles = {}
         for i, user_name in enumerate(chart_data['users'].keys()):
-            user_colors[user_name] = colors[i % len(colors)]
+            color = colors[i % len(colors)]
+            user_colors[user_name] = color
+            dataset_styles[user_name] = {
+                'borderColor': color,
+                'backgroundColor': color + '20',
+                'fill': False,
+                'tension': 0.1
+            }
+        
+        # Users with no activity at all would only add flat zero lines to the charts
+        charted_users = [
+            (user_name, user_data) for user_name, user_data in chart_data['users'].items()
+            if any(user_data['totals'].values())
+        ]
         
         # Generate datasets for each chart
         def generate_datasets(metric):
-            datasets = []
-            for user_name, user_data in chart_data['users'].items():
-                datasets.append({
-                    'label': user_name,
-                    'data': user_data[metric],
-                    'borderColor': user_colors[user_name],
-                    'backgroundColor': user_colors[user_name] + '20',
-                    'fill': False,
-                    'tension': 0.1
-                })
-            return datasets
+            return [
+                {'label': user_name, 'data': user_data[metric], **dataset_styles[user_name]}
+                for user_name, user_data in charted_users
+            ]
         
-        html_template = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Cursor Analytics Dashboard</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        .header h1 {{
-            margin: 0;
-            font-size: 2.5em;
-            font-weight: 300;
-        }}
-        .header p {{
-            margin: 10px 0 0 0;
-            opacity: 0.9;
-            font-size: 1.1em;
-        }}
-        .summary {{
-            padding: 30px;
-            background: #f8f9fa;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        .summary h2 {{
-            margin: 0 0 20px 0;
-            color: #495057;
-        }}
-        .summary-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-        }}
-        .summary-card {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-            text-align: center;
-        }}
-        .summary-card h3 {{
-            margin: 0 0 10px 0;
-            color: #6c757d;
-            font-size: 0.9em;
-            font-weight: 500;
-            text-transform: uppercase;
-        }}
-        .summary-card .value {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #495057;
-        }}
-        .charts-container {{
-            padding: 30px;
-        }}
-        .chart-section {{
-            margin-bottom: 50px;
-        }}
-        .chart-section h2 {{
-            margin: 0 0 20px 0;
-            color: #495057;
-            text-align: center;
-            font-size: 1.8em;
-        }}
-        .chart-container {{
-            position: relative;
-            height: 400px;
-            margin: 20px 0;
-        }}
-        .legend {{
-            margin-top: 20px;
-            display: flex;
-            flex-wrap: wrap;
-            justify-content: center;
-            gap: 15px;
-        }}
-        .legend-item {{
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            padding: 5px 10px;
-            background: #f8f9fa;
-            border-radius: 15px;
-            font-size: 0.9em;
-        }}
-        .legend-color {{
-            width: 12px;
-            height: 12px;
-            border-radius: 50%;
-        }}
-        .date-range {{
-            text-align: center;
-            color: #6c757d;
-            font-style: italic;
-            margin-bottom: 30px;
-        }}
-        .leaderboards {{
-            padding: 30px;
-            background: #f8f9fa;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        .leaderboards h2 {{
-            margin: 0 0 30px 0;
-            color: #495057;
-            text-align: center;
-            font-size: 1.8em;
-        }}
-        .leaderboard-grid {{
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 30px;
-        }}
-        .leaderboard {{
-            background: white;
-            border-radius: 12px;
-            padding: 25px;
-            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-        }}
-        .leaderboard h3 {{
-            margin: 0 0 20px 0;
-            color: #495057;
-            text-align: center;
-            font-size: 1.3em;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 8px;
-        }}
-        .leaderboard-item {{
-            display: flex;
-            align-items: center;
-            padding: 12px 0;
-            border-bottom: 1px solid #f0f0f0;
-        }}
-        .leaderboard-item:last-child {{
-            border-bottom: none;
-        }}
-        .rank {{
-            font-size: 1.2em;
-            font-weight: bold;
-            width: 30px;
-            text-align: center;
-            color: #6c757d;
-        }}
-        .rank.gold {{ color: #ffd700; }}
-        .rank.silver {{ color: #c0c0c0; }}
-        .rank.bronze {{ color: #cd7f32; }}
-        .user-info {{
-            flex: 1;
-            margin-left: 15px;
-        }}
-        .user-name {{
-            font-weight: 600;
-            color: #495057;
-            font-size: 1em;
-        }}
-        .user-value {{
-            font-size: 1.1em;
-            font-weight: bold;
-            text-align: right;
-            color: #28a745;
-        }}
-        .trophy {{
-            font-size: 1.5em;
-            margin-right: 5px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>📊 Cursor Analytics Dashboard</h1>
-            <p>Daily User Activity Breakdown</p>
-        </div>
+        fp.write(_REPORT_HTML_HEAD)
+        fp.write(f"""
         
         <div class="date-range">
             <p>Period: {chart_data['dates'][0]} to {chart_data['dates'][-1]}</p>
@@ -912,103 +1284,48 @@ class RequestAggregator:
         
         <div class="summary">
             <h2>📈 Summary Statistics</h2>
-            <div class="summary-grid">"""
+            <div class="summary-grid">""")
         
-        # Add summary cards for each user
-        for user_name, user_data in chart_data['users'].items():
-            html_template += f"""
+        # Add summary cards for each user, written in one go
+        fp.write(''.join(f"""
                 <div class="summary-card">
                     <h3>{user_name}</h3>
                     <div class="value" style="color: {user_colors[user_name]}">{user_data['totals']['total_chats']}</div>
                     <small>Total Chats</small>
-                </div>"""
+                </div>""" for user_name, user_data in chart_data['users'].items()))
         
-        html_template += """
+        fp.write("""
             </div>
-        </div>"""
+        </div>""")
         
         # Generate leaderboards
-        # Sort users by total chats and lines of agent edits
-        chat_leaders = sorted(chart_data['users'].items(), 
-                             key=lambda x: x[1]['totals']['total_chats'], reverse=True)[:10]
-        lines_leaders = sorted(chart_data['users'].items(), 
-                              key=lambda x: x[1]['totals']['lines_of_agent_edits'], reverse=True)[:10]
-        
-        html_template += f"""
+        # Rank users with activity by total chats and lines of agent edits
+        leader_rows = [
+            (user_name, user_data['totals']['total_chats'], user_data['totals']['lines_of_agent_edits'])
+            for user_name, user_data in chart_data['users'].items()
+        ]
+        chat_leaders = heapq.nlargest(10, (
+            (user_name, chats) for user_name, chats, _ in leader_rows if chats > 0
+        ), key=itemgetter(1))
+        lines_leaders = heapq.nlargest(10, (
+            (user_name, lines) for user_name, _, lines in leader_rows if lines > 0
+        ), key=itemgetter(1))
+        
+        fp.write(f"""
         <div class="leaderboards">
             <h2>🏆 Team Leaderboards</h2>
             <p style="text-align: center; color: #6c757d; margin-top: -15px; margin-bottom: 25px;">
                 Period: {chart_data['dates'][0]} to {chart_data['dates'][-1]}
             </p>
-            <div class="leaderboard-grid">
-                <div class="leaderboard">
-                    <h3><span class="trophy">💬</span>Chat Champions</h3>"""
-        
-        # Generate chat leaderboard
-        for i, (user_name, user_data) in enumerate(chat_leaders, 1):
-            rank_class = ""
-            trophy_emoji = ""
-            if i == 1:
-                rank_class = "gold"
-                trophy_emoji = "🥇"
-            elif i == 2:
-                rank_class = "silver" 
-                trophy_emoji = "🥈"
-            elif i == 3:
-                rank_class = "bronze"
-                trophy_emoji = "🥉"
-            else:
-                trophy_emoji = f"{i}"
-                
-            chats = user_data['totals']['total_chats']
-            if chats > 0:  # Only show users with activity
-                html_template += f"""
-                    <div class="leaderboard-item">
-                        <div class="rank {rank_class}">{trophy_emoji}</div>
-                        <div class="user-info">
-                            <div class="user-name">{user_name}</div>
-                        </div>
-                        <div class="user-value">{chats:,}</div>
-                    </div>"""
-        
-        html_template += """
-                </div>
-                <div class="leaderboard">
-                    <h3><span class="trophy">✏️</span>Code Edit Leaders</h3>"""
-        
-        # Generate lines leaderboard
-        for i, (user_name, user_data) in enumerate(lines_leaders, 1):
-            rank_class = ""
-            trophy_emoji = ""
-            if i == 1:
-                rank_class = "gold"
-                trophy_emoji = "🥇"
-            elif i == 2:
-                rank_class = "silver"
-                trophy_emoji = "🥈"
-            elif i == 3:
-                rank_class = "bronze"
-                trophy_emoji = "🥉"
-            else:
-                trophy_emoji = f"{i}"
-                
-            lines = user_data['totals']['lines_of_agent_edits']
-            if lines > 0:  # Only show users with activity
-                html_template += f"""
-                    <div class="leaderboard-item">
-                        <div class="rank {rank_class}">{trophy_emoji}</div>
-                        <div class="user-info">
-                            <div class="user-name">{user_name}</div>
-                        </div>
-                        <div class="user-value">{lines:,}</div>
-                    </div>"""
+            <div class="leaderboard-grid">""")
+        fp.write(_render_leaderboard("Chat Champions", "💬", chat_leaders))
+        fp.write(_render_leaderboard("Code Edit Leaders", "✏️", lines_leaders))
         
-        html_template += """
-                </div>
+        fp.write("""
             </div>
         </div>
         
-        <div class="charts-container">"""
+        <div class="charts-container">""")
         
         # Generate each chart
         chart_configs = [
@@ -1017,18 +1334,20 @@ class RequestAggregator:
             ('lines_of_agent_edits', 'Lines of Agent Edits per Day', '✏️')
         ]
         
+        # Build each metric's datasets and the shared date labels once
+        datasets_by_metric = {metric: generate_datasets(metric) for metric, _, _ in chart_configs}
+        dates_json = to_json(chart_data['dates']).decode()
+        
         for metric, title, emoji in chart_configs:
-            datasets = generate_datasets(metric)
-            
-            html_template += f"""
+            fp.write(f"""
             <div class="chart-section">
                 <h2>{emoji} {title}</h2>
                 <div class="chart-container">
                     <canvas id="{metric}Chart"></canvas>
                 </div>
-            </div>"""
+            </div>""")
         
-        html_template += """
+        fp.write("""
         </div>
     </div>
 
@@ -1064,7 +1383,8 @@ class RequestAggregator:
                         display: true,
                         text: 'Count'
                     },
-                    beginAtZero: true
+                    beginAtZero: true,
+                    min: 0
                 }
             },
             interaction: {
@@ -1072,78 +1392,50 @@ class RequestAggregator:
                 axis: 'x',
                 intersect: false
             }
-        };"""
+        };""")
         
         # Generate JavaScript for each chart
-        import json
-        
+        debug_js = logger.isEnabledFor(logging.DEBUG)
         for metric, title, emoji in chart_configs:
-            datasets = generate_datasets(metric)
+            datasets_json = to_json(datasets_by_metric[metric]).decode()
             
-            # Debug: Print data to console
-            html_template += f"""
+            fp.write(f"""
         
-        // {title}
+        // {title}""")
+            
+            # Debug: Print data to the browser console (debug runs only)
+            if debug_js:
+                fp.write(f"""
         console.log('Chart data for {metric}:', {{
-            labels: {json.dumps(chart_data['dates'])},
-            datasets: {json.dumps(datasets)}
-        }});
+            labels: {dates_json},
+            datasets: {datasets_json}
+        }});""")
+            
+            fp.write(f"""
         
         new Chart(document.getElementById('{metric}Chart'), {{
             type: 'line',
             data: {{
-                labels: {json.dumps(chart_data['dates'])},
-                datasets: {json.dumps(datasets)}
+                labels: {dates_json},
+                datasets: {datasets_json}
             }},
             options: {{
-                responsive: true,
-                maintainAspectRatio: false,
+                ...chartOptions,
                 plugins: {{
-                    legend: {{
-                        display: true,
-                        position: 'top'
-                    }},
-                    tooltip: {{
-                        mode: 'index',
-                        intersect: false,
-                    }},
+                    ...chartOptions.plugins,
                     title: {{
                         display: true,
                         text: '{title}'
                     }}
-                }},
-                scales: {{
-                    x: {{
-                        display: true,
-                        title: {{
-                            display: true,
-                            text: 'Date'
-                        }}
-                    }},
-                    y: {{
-                        display: true,
-                        title: {{
-                            display: true,
-                            text: 'Count'
-                        }},
-                        beginAtZero: true,
-                        min: 0
-                    }}
-                }},
-                interaction: {{
-                    mode: 'nearest',
-                    axis: 'x',
-                    intersect: false
                 }}
             }}
-        }});"""
+        }});""")
         
-        html_template += """
+        fp.write("""
     </script>
 </body>
-</html>"""
+</html>""")
         
-        return html_template
 
 
 def show_available_groups():
@@ -1171,6 +1463,7 @@ class LiveDashboardGenerator:
         excluded_emails: List of emails to exclude from the dashboard (optional)
         people_to_include: List of emails to include in dashboard (if provided, only these emails will be processed)
         group_name: Name of predefined group to run report on (optional)
+        cache_dir: Directory for cached analytics responses, or None to disable caching
     
     Filtering Logic:
         1. If group_name is provided: use emails from that predefined group
@@ -1179,9 +1472,9 @@ class LiveDashboardGenerator:
         4. Then apply excluded_emails filter as a secondary filter
     """
     
-    def __init__(self, cookie_string: str, excluded_emails: List[str] = None, people_to_include: List[str] = None, group_name: str = None):
+    def __init__(self, cookie_string: str, excluded_emails: List[str] = None, people_to_include: List[str] = None, group_name: str = None, cache_dir: Optional[str] = ANALYTICS_CACHE_DIR):
         self.cookie_string = cookie_string
-        self.aggregator = RequestAggregator(cookie_string)
+        self.aggregator = RequestAggregator(cookie_string, cache_dir=cache_dir)
         self.excluded_emails = excluded_emails or []
         self.people_to_include = people_to_include or []
         self.group_name = group_name
@@ -1198,6 +1491,15 @@ class LiveDashboardGenerator:
             
             self.people_to_include = group_emails
             print(f"📋 Using predefined group '{self.group_name}' with {len(group_emails)} members")
+    
+    async def __aenter__(self) -> "LiveDashboardGenerator":
+        """Share one client across all fetches made through the aggregator."""
+        await self.aggregator.__aenter__()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Release the aggregator's client."""
+        await self.aggregator.__aexit__(exc_type, exc_val, exc_tb)
         
     async def fetch_real_data(self, team_id: int, days_back: int = 7) -> Dict[str, Any]:
         """Fetch real data from the Cursor Admin SDK."""
@@ -1253,14 +1555,11 @@ class LiveDashboardGenerator:
         prev_week_end = end_date - timedelta(days=7)
         prev_week_start = end_date - timedelta(days=14)
         
-        # 🐛 DEBUG: Print date ranges
-        print(f"\n🗓️  DATE RANGE DEBUG:")
-        print(f"   Current time: {datetime.now().isoformat()}")
-        print(f"   End date: {end_date.isoformat()}")
-        print(f"   Start date: {start_date.isoformat()}")
-        print(f"   Previous week start: {prev_week_start.isoformat()}")
-        print(f"   Previous week end: {prev_week_end.isoformat()}")
-        print(f"   Days back: {days_back}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        # 🐛 DEBUG: Log date ranges
+        logger.debug("🗓️  DATE RANGE DEBUG: end=%s start=%s prev_week_start=%s prev_week_end=%s days_back=%d",
+                     end_date, start_date, prev_week_start, prev_week_end, days_back)
         
         # Fetch real user data
         users_data = []
@@ -1292,7 +1591,8 @@ class LiveDashboardGenerator:
                 'display': f"{day_name}\n{date_str}"
             })
         
-        print(f"🗓️  Generated dates: {[d['full_date'] for d in dates_and_days]}")
+        full_dates = [d['full_date'] for d in dates_and_days]
+        logger.debug("🗓️  Generated dates: %s", full_dates)
         
         # Initialize weekly data structures with actual dates
         for date_info in dates_and_days:
@@ -1317,41 +1617,43 @@ class LiveDashboardGenerator:
         prev_week_total_chats = 0
         prev_week_total_completions = 0
         
-        # Store weekly data for growth calculation
-        user_weekly_data = {}
+        # Per-day columns (one list per active user) for the daily team totals
+        lines_columns = []
+        chats_columns = []
+        completions_columns = []
+        
+        async def _fetch_both_weeks(email: str) -> List[Any]:
+            """Fetch current and previous week stats for one user concurrently."""
+            team_id_resolved, user_id = self.aggregator.resolve_email_to_userid(email)
+            return await asyncio.gather(
+                self.aggregator.fetch_user_stats_bounded(team_id_resolved, user_id, start_date, end_date),
+                self.aggregator.fetch_user_stats_bounded(team_id_resolved, user_id, prev_week_start, prev_week_end),
+                return_exceptions=True
+            )
+        
+        # Fetch every member's two weeks at once (bounded by the aggregator's
+        # concurrency limit), then process the results in team order
+        week_results = await asyncio.gather(
+            *(_fetch_both_weeks(email) for email in all_emails),
+            return_exceptions=True
+        )
         
-        for i, email in enumerate(all_emails):
+        for i, (email, result) in enumerate(zip(all_emails, week_results)):
             try:
-                team_id_resolved, user_id = self.aggregator.resolve_email_to_userid(email)
+                if isinstance(result, Exception):
+                    raise result
+                user_stats, prev_week_stats = result
                 
-                # Fetch current week stats
-                try:
-                    user_stats = await self.aggregator.aggregate_requests_for_user(
-                        team_id=team_id_resolved,
-                        user_id=user_id,
-                        start_date=start_date,
-                        end_date=end_date
-                    )
-                except Exception as stats_error:
-                    print(f"❌ Error fetching current week stats for {email}: {stats_error}")
+                # Current week stats are required
+                if isinstance(user_stats, Exception):
+                    print(f"❌ Error fetching current week stats for {email}: {user_stats}")
                     continue
                 
-                # Fetch previous week stats for growth calculation
-                try:
-                    prev_week_stats = await self.aggregator.aggregate_requests_for_user(
-                        team_id=team_id_resolved,
-                        user_id=user_id,
-                        start_date=prev_week_start,
-                        end_date=prev_week_end
-                    )
-                except Exception as prev_stats_error:
-                    print(f"❌ Error fetching previous week stats for {email}: {prev_stats_error}")
+                # Previous week stats are only used for growth calculation
+                if isinstance(prev_week_stats, Exception):
+                    print(f"❌ Error fetching previous week stats for {email}: {prev_week_stats}")
                     # Continue with zero previous week stats
-                    prev_week_stats = {
-                        'lines_of_agent_edits': 0,
-                        'total_requests': 0,
-                        'total_tabs_accepted': 0
-                    }
+                    prev_week_stats = _EMPTY_WEEK_STATS
                 
                 # Skip inactive users (no activity in either week)
                 if (user_stats['total_requests'] == 0 and user_stats['lines_of_agent_edits'] == 0 and
@@ -1374,13 +1676,10 @@ class LiveDashboardGenerator:
                     # If no previous week activity but current week activity, it's new growth
                     agent_growth = 100.0 if current_lines > 0 else 0.0
                 
-                # 🐛 DEBUG: Print user statistics
-                print(f"\n👤 DEBUG - {name} ({email}):")
-                print(f"   Lines of Agent: {current_lines} (prev: {previous_lines})")
-                print(f"   Chat Interactions: {user_stats['total_requests']}")
-                print(f"   Tab Completions: {tab_completions} (REAL DATA)")
-                print(f"   Agent Growth: {agent_growth}%")
-                print(f"   Daily breakdown entries: {len(user_stats.get('daily_breakdown', []))}")
+                # 🐛 DEBUG: Log user statistics
+                logger.debug("👤 %s (%s): lines=%d (prev: %d) chats=%d tabs=%d growth=%s%% days=%d",
+                             name, email, current_lines, previous_lines, user_stats['total_requests'],
+                             tab_completions, agent_growth, user_stats['days_analyzed'])
                 
                 user_data = {
                     "id": i + 1,
@@ -1388,6 +1687,7 @@ class LiveDashboardGenerator:
                     "avatar": "",
                     "email": email,
                     "linesOfAgent": user_stats['lines_of_agent_edits'],
+                    "previousWeekLines": previous_lines,
                     "chats": user_stats['total_requests'],
                     "tabCompletions": tab_completions,
                     "agentGrowth": agent_growth
@@ -1395,50 +1695,45 @@ class LiveDashboardGenerator:
                 
                 active_users.append(user_data)
                 
-                # Store weekly data for growth calculation
-                user_weekly_data[name] = {
-                    'current_week': user_stats['lines_of_agent_edits'],
-                    'previous_week': prev_week_stats['lines_of_agent_edits']
-                }
-                
                 # Use real daily breakdown data from the SDK
-                daily_breakdown = user_stats.get('daily_breakdown', [])
-                
-                # 🐛 DEBUG: Print daily breakdown sample
-                print(f"   📅 Daily breakdown sample:")
-                for i, day in enumerate(daily_breakdown[:3]):  # Show first 3 days
-                    print(f"      Day {i+1}: {day}")
-                if len(daily_breakdown) > 3:
-                    print(f"      ... and {len(daily_breakdown) - 3} more days")
+                daily_breakdown = user_stats['daily_breakdown']
+                breakdown_dates = daily_breakdown['date']  # YYYY-MM-DD
                 
-                # Create maps of full dates to their daily values
-                user_daily_lines = {}
-                user_daily_chats = {}
-                user_daily_completions = {}
+                # 🐛 DEBUG: Log daily breakdown sample (first 3 days)
+                if debug:
+                    for day_number in range(min(3, len(breakdown_dates))):
+                        logger.debug("   📅 Day %d: %s", day_number + 1,
+                                     {key: column[day_number] for key, column in daily_breakdown.items()})
+                    if len(breakdown_dates) > 3:
+                        logger.debug("      ... and %d more days", len(breakdown_dates) - 3)
                 
-                for daily_data in daily_breakdown:
-                    try:
-                        date_key = daily_data['date']  # Should be in YYYY-MM-DD format
-                        user_daily_lines[date_key] = daily_data['lines_of_agent_edits']
-                        user_daily_chats[date_key] = daily_data.get('total_chats', 0)
-                        user_daily_completions[date_key] = daily_data.get('total_tabs_accepted', 0)
-                    except KeyError as e:
-                        print(f"      ⚠️  KeyError in daily data: {e}")
-                        continue
-                
-                # 🐛 DEBUG: Print date matching
-                print(f"   🔍 Date matching debug:")
-                for idx, day_data in enumerate(weekly_data_by_user):
-                    full_date = day_data['full_date']
-                    lines_value = user_daily_lines.get(full_date, 0)
-                    print(f"      {full_date}: {lines_value} lines")
+                # Map each full date to its (lines, chats, completions) values
+                by_date = dict(zip(breakdown_dates, zip(
+                    daily_breakdown['lines_of_agent_edits'],
+                    daily_breakdown['total_chats'],
+                    daily_breakdown['total_tabs_accepted']
+                )))
                 
                 # Add real data to weekly structures using full date matching
-                for idx, day_data in enumerate(weekly_data_by_user):
-                    full_date = day_data['full_date']
-                    day_data[name] = user_daily_lines.get(full_date, 0)
-                    weekly_chats_by_user[idx][name] = user_daily_chats.get(full_date, 0)
-                    weekly_completions_by_user[idx][name] = user_daily_completions.get(full_date, 0)
+                lines_column, chats_column, completions_column = map(
+                    list, zip(*[by_date.get(full_date, _NO_DAILY_ACTIVITY) for full_date in full_dates])
+                )
+                
+                # 🐛 DEBUG: Log date matching
+                if debug:
+                    logger.debug("   🔍 Date matching: %s",
+                                 ", ".join(f"{full_date}={lines_value}"
+                                           for full_date, lines_value in zip(full_dates, lines_column)))
+                for lines_day, chats_day, completions_day, lines_value, chats_value, completions_value in zip(
+                    weekly_data_by_user, weekly_chats_by_user, weekly_completions_by_user,
+                    lines_column, chats_column, completions_column
+                ):
+                    lines_day[name] = lines_value
+                    chats_day[name] = chats_value
+                    completions_day[name] = completions_value
+                lines_columns.append(lines_column)
+                chats_columns.append(chats_column)
+                completions_columns.append(completions_column)
                 
                 # Accumulate totals
                 total_lines += user_stats['lines_of_agent_edits']
@@ -1462,43 +1757,35 @@ class LiveDashboardGenerator:
             raise ValueError("No active users found in the specified time period.")
         
         # Sort by performance
-        active_users.sort(key=lambda x: x['linesOfAgent'], reverse=True)
-        
-        # Generate growth metrics with real week-over-week data
-        growth_metrics = []
-        for user in active_users:
-            name = user['name']
-            if name in user_weekly_data:
-                current_week = user_weekly_data[name]['current_week']
-                previous_week = user_weekly_data[name]['previous_week']
-                
-                # Calculate growth percentage
-                if previous_week > 0:
-                    growth = ((current_week - previous_week) / previous_week) * 100
-                else:
-                    # If no previous week activity but current week activity, it's new growth
-                    growth = 100.0 if current_week > 0 else 0.0
-                
-                growth_metrics.append({
-                    "name": user['name'],
-                    "currentWeek": current_week,
-                    "previousWeek": previous_week,
-                    "growth": round(growth, 1),
-                    "avatar": ""
-                })
+        active_users.sort(key=itemgetter('linesOfAgent'), reverse=True)
+        
+        # Generate growth metrics with real week-over-week data, reusing the
+        # agent growth already computed for each user
+        growth_metrics = [
+            {
+                "name": user['name'],
+                "currentWeek": user['linesOfAgent'],
+                "previousWeek": user['previousWeekLines'],
+                "growth": user['agentGrowth'],
+                "avatar": ""
+            }
+            for user in active_users
+        ]
         
         # Sort by growth percentage (highest first)
-        growth_metrics.sort(key=lambda x: x['growth'], reverse=True)
+        growth_metrics.sort(key=itemgetter('growth'), reverse=True)
         
         # 🐛 FIXED: Create weekly aggregate data using REAL daily totals instead of estimates
         weekly_data = []
-        for idx, day_data in enumerate(weekly_data_by_user):
-            # Sum REAL daily values for all users for this day
-            day_total_lines = sum(day_data.get(user['name'], 0) for user in active_users)
-            day_total_chats = sum(weekly_chats_by_user[idx].get(user['name'], 0) for user in active_users)
-            day_total_completions = sum(weekly_completions_by_user[idx].get(user['name'], 0) for user in active_users)
-            
-            print(f"📊 Day {day_data['display']}: {day_total_lines} lines, {day_total_chats} chats, {day_total_completions} completions (REAL DATA)")
+        # Sum REAL daily values for all users: each day is one row across the user columns
+        for day_data, day_total_lines, day_total_chats, day_total_completions in zip(
+            weekly_data_by_user,
+            map(sum, zip(*lines_columns)),
+            map(sum, zip(*chats_columns)),
+            map(sum, zip(*completions_columns))
+        ):
+            logger.debug("📊 Day %s: %d lines, %d chats, %d completions",
+                         day_data['full_date'], day_total_lines, day_total_chats, day_total_completions)
             
             weekly_data.append({
                 "day": day_data['display'],  # Use display format with dates
@@ -1506,12 +1793,10 @@ class LiveDashboardGenerator:
                 "tabCompletions": day_total_completions  # REAL aggregated completions
             })
         
-        # 🐛 DEBUG: Print final summary
-        print(f"\n📊 FINAL SUMMARY DEBUG:")
-        print(f"   Active users: {len(active_users)}")
-        print(f"   Total lines: {total_lines} (prev week: {prev_week_total_lines})")
-        print(f"   Total chats: {total_chats} (prev week: {prev_week_total_chats})")
-        print(f"   Total completions: {total_completions} (prev week: {prev_week_total_completions})")
+        # 🐛 DEBUG: Log final summary
+        logger.debug("📊 FINAL SUMMARY: active=%d lines=%d (prev: %d) chats=%d (prev: %d) completions=%d (prev: %d)",
+                     len(active_users), total_lines, prev_week_total_lines, total_chats, prev_week_total_chats,
+                     total_completions, prev_week_total_completions)
         
         # Calculate pie chart values
         grand_total = total_completions + total_chats + total_lines
@@ -1522,112 +1807,109 @@ class LiveDashboardGenerator:
         else:
             tab_pct = chat_pct = lines_pct = 0.0
             
-        print(f"   Pie chart percentages: Tab={tab_pct}%, Chat={chat_pct}%, Lines={lines_pct}%")
+        logger.debug("   Pie chart percentages: Tab=%s%%, Chat=%s%%, Lines=%s%%", tab_pct, chat_pct, lines_pct)
         
         # Calculate Persistent Daily Usage Leaderboard
         print(f"\n🏆 CALCULATING PERSISTENT USAGE LEADERBOARD...")
         persistent_leaderboard = []
+        progress_lines = []
         
         for user in active_users:
             name = user['name']
+            email = user['email']
             
-            # Find user's daily breakdown from the stored data
-            user_daily_data = {}
-            
-            # Get the user's actual daily breakdown from their processed stats
-            for i, email in enumerate(all_emails):
-                user_name_from_email = email.split('@')[0].replace('.', ' ').title()
-                if user_name_from_email == name:
-                    # Find this user's aggregated stats to get daily breakdown
-                    try:
-                        team_id_resolved, user_id = self.aggregator.resolve_email_to_userid(email)
-                        
-                        # Re-fetch their daily breakdown for consistency analysis
-                        user_stats_for_consistency = await self.aggregator.aggregate_requests_for_user(
-                            team_id=team_id_resolved,
-                            user_id=user_id,
-                            start_date=start_date,
-                            end_date=end_date
-                        )
-                        
-                        daily_breakdown = user_stats_for_consistency.get('daily_breakdown', [])
-                        
-                        # Calculate consistency metrics
-                        total_days = days_back + 1  # Include today
-                        active_days = 0
-                        total_activity = 0
-                        max_daily_activity = 0
-                        daily_activities = []
-                        
-                        for daily_data in daily_breakdown:
-                            lines_edited = daily_data.get('lines_of_agent_edits', 0)
-                            daily_activity = (
-                                daily_data.get('total_chats', 0) +
-                                daily_data.get('total_tabs_accepted', 0) +
-                                (lines_edited / 100)  # Scale down lines for balance
-                            )
-                            
-                            daily_activities.append(daily_activity)
-                            total_activity += daily_activity
-                            
-                            # Apply 500-line threshold for active day definition
-                            if lines_edited >= 500:
-                                active_days += 1
-                                
-                            if daily_activity > max_daily_activity:
-                                max_daily_activity = daily_activity
-                        
-                        # Calculate consistency metrics
-                        activity_ratio = active_days / total_days if total_days > 0 else 0
-                        avg_daily_activity = total_activity / total_days if total_days > 0 else 0
-                        
-                        # Calculate activity variance (lower is more consistent)
-                        if len(daily_activities) > 1:
-                            mean_activity = sum(daily_activities) / len(daily_activities)
-                            variance = sum((x - mean_activity) ** 2 for x in daily_activities) / len(daily_activities)
-                            consistency_score = 1 / (1 + variance) if variance > 0 else 1.0
-                        else:
-                            consistency_score = 1.0 if daily_activities and daily_activities[0] > 0 else 0.0
-                        
-                        # Combined persistence score (weighted combination)
-                        persistence_score = (
-                            activity_ratio * 0.4 +  # 40% weight on daily consistency
-                            min(avg_daily_activity / 20, 1.0) * 0.3 +  # 30% weight on activity level (capped)
-                            consistency_score * 0.3  # 30% weight on activity consistency
-                        ) * 100
-                        
-                        persistent_leaderboard.append({
-                            "name": name,
-                            "email": email,
-                            "activeDays": active_days,
-                            "totalDays": total_days,
-                            "activityRatio": round(activity_ratio * 100, 1),
-                            "avgDailyActivity": round(avg_daily_activity, 1),
-                            "maxDailyActivity": round(max_daily_activity, 1),
-                            "persistenceScore": round(persistence_score, 1),
-                            "consistencyScore": round(consistency_score * 100, 1),
-                            "totalActivity": round(total_activity, 1)
-                        })
-                        
-                        print(f"   📊 {name}: {active_days}/{total_days} days with 500+ lines ({activity_ratio*100:.1f}%), "
-                              f"avg daily: {avg_daily_activity:.1f}, persistence: {persistence_score:.1f}")
-                        
-                        break
+            try:
+                team_id_resolved, user_id = self.aggregator.resolve_email_to_userid(email)
+                
+                # Re-fetch their daily breakdown for consistency analysis
+                user_stats_for_consistency = await self.aggregator.aggregate_requests_for_user(
+                    team_id=team_id_resolved,
+                    user_id=user_id,
+                    start_date=start_date,
+                    end_date=end_date
+                )
+                
+                daily_breakdown = user_stats_for_consistency['daily_breakdown']
+                
+                # Calculate consistency metrics
+                total_days = days_back + 1  # Include today
+                active_days = 0
+                total_activity = 0
+                max_daily_activity = 0
+                daily_activities = []
+                
+                for chats, tabs, lines_edited in zip(
+                    daily_breakdown['total_chats'],
+                    daily_breakdown['total_tabs_accepted'],
+                    daily_breakdown['lines_of_agent_edits']
+                ):
+                    daily_activity = (
+                        chats +
+                        tabs +
+                        (lines_edited / 100)  # Scale down lines for balance
+                    )
+                    
+                    daily_activities.append(daily_activity)
+                    total_activity += daily_activity
+                    
+                    # Apply 500-line threshold for active day definition
+                    if lines_edited >= 500:
+                        active_days += 1
                         
-                    except Exception as e:
-                        print(f"   ❌ Error calculating persistence for {name}: {e}")
-                        continue
+                    if daily_activity > max_daily_activity:
+                        max_daily_activity = daily_activity
+                
+                # Calculate consistency metrics
+                activity_ratio = active_days / total_days if total_days > 0 else 0
+                avg_daily_activity = total_activity / total_days if total_days > 0 else 0
+                
+                # Calculate activity variance (lower is more consistent)
+                if len(daily_activities) > 1:
+                    mean_activity = sum(daily_activities) / len(daily_activities)
+                    variance = sum((x - mean_activity) ** 2 for x in daily_activities) / len(daily_activities)
+                    consistency_score = 1 / (1 + variance) if variance > 0 else 1.0
+                else:
+                    consistency_score = 1.0 if daily_activities and daily_activities[0] > 0 else 0.0
+                
+                # Combined persistence score (weighted combination)
+                persistence_score = (
+                    activity_ratio * 0.4 +  # 40% weight on daily consistency
+                    min(avg_daily_activity / 20, 1.0) * 0.3 +  # 30% weight on activity level (capped)
+                    consistency_score * 0.3  # 30% weight on activity consistency
+                ) * 100
+                
+                persistent_leaderboard.append({
+                    "name": name,
+                    "email": email,
+                    "activeDays": active_days,
+                    "totalDays": total_days,
+                    "activityRatio": round(activity_ratio * 100, 1),
+                    "avgDailyActivity": round(avg_daily_activity, 1),
+                    "maxDailyActivity": round(max_daily_activity, 1),
+                    "persistenceScore": round(persistence_score, 1),
+                    "consistencyScore": round(consistency_score * 100, 1),
+                    "totalActivity": round(total_activity, 1)
+                })
+                
+                progress_lines.append(
+                    f"   📊 {name}: {active_days}/{total_days} days with 500+ lines ({activity_ratio*100:.1f}%), "
+                    f"avg daily: {avg_daily_activity:.1f}, persistence: {persistence_score:.1f}"
+                )
+
+            except Exception as e:
+                progress_lines.append(f"   ❌ Error calculating persistence for {name}: {e}")
         
         # Sort by persistence score and take top 5
-        persistent_leaderboard.sort(key=lambda x: x['persistenceScore'], reverse=True)
+        persistent_leaderboard.sort(key=itemgetter('persistenceScore'), reverse=True)
         top_persistent_users = persistent_leaderboard[:5]
         
-        print(f"\n🏆 TOP 5 PERSISTENT DAILY USERS:")
+        progress_lines.append(f"\n🏆 TOP 5 PERSISTENT DAILY USERS:")
         for i, user in enumerate(top_persistent_users, 1):
-            print(f"   {i}. {user['name']}: {user['persistenceScore']}% persistence score "
-                  f"({user['activeDays']}/{user['totalDays']} days active)")
+            progress_lines.append(f"   {i}. {user['name']}: {user['persistenceScore']}% persistence score "
+                                  f"({user['activeDays']}/{user['totalDays']} days active)")
         
-        print(f"   Total users analyzed for persistence: {len(persistent_leaderboard)}")
+        progress_lines.append(f"   Total users analyzed for persistence: {len(persistent_leaderboard)}")
+        _print_lines(progress_lines)
         
         # Return data in the exact format expected by the HTML
         return {
@@ -1675,7 +1957,7 @@ class LiveDashboardGenerator:
             raise ValueError("Could not find dashboard data in template")
         
         # Create new data block
-        real_data_json = json.dumps(data, indent=12)
+        real_data_json = to_json(data, indent=12).decode()
         new_data_block = f"const dashboardData = {real_data_json};"
         
         # Replace the data
@@ -3191,7 +3473,20 @@ async def main():
     parser.add_argument('--cookie', '-c', type=str, help='Cookie string from authenticated browser session (overrides CURSOR_COOKIE_STRING env var)')
     parser.add_argument('--team-id', '-t', type=int, help='Team ID from Cursor dashboard (overrides TEAM_ID env var)')
     
+    parser.add_argument('--no-cache', action='store_true',
+                       help=f'Always fetch from the API instead of reusing responses cached in {ANALYTICS_CACHE_DIR}/')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='Log per-user debug details (date matching, daily breakdowns)')
+    
     args = parser.parse_args()
+    if args.verbose:
+        # Only this module's diagnostics; the root logger (aiohttp, asyncio,
+        # cursor_admin_sdk) stays at its default WARNING level
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
     
     # Handle list groups command
     if args.list_groups:
@@ -3285,10 +3580,12 @@ async def main():
         if excluded_emails:
             print(f"🚫 Excluding emails: {', '.join(excluded_emails)}")
         
-        generator = LiveDashboardGenerator(cookie_string, excluded_emails, people_to_include, group_name)
-        
-        # Fetch real data
-        real_data = await generator.fetch_real_data(team_id, days_back)
+        # Fetch real data over a single client shared by all requests
+        async with LiveDashboardGenerator(
+            cookie_string, excluded_emails, people_to_include, group_name,
+            cache_dir=None if args.no_cache else ANALYTICS_CACHE_DIR
+        ) as generator:
+            real_data = await generator.fetch_real_data(team_id, days_back)
         
         # Generate HTML with real data
         html_content = generator.generate_html_with_data(real_data)
@@ -3350,4 +3647,12 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Use uvloop's faster event loop when it is installed (it is optional)
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+    
+    asyncio.run(main(), loop_factory=loop_factory)
\ No newline at end of file
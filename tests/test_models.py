@@ -0,0 +1,67 @@
+"""Tests for dashboard model validation."""
+
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from cursor_admin_sdk import DashboardDailyMetric, ExtensionUsage, ModelUsage, UsageCount, UsageEvent
+
+
+def test_usage_rows_accept_api_objects():
+    metric = DashboardDailyMetric.model_validate({
+        "date": "1700000000000",
+        "modelUsage": [{"name": "gpt", "count": 3}],
+        "extensionUsage": None,
+    })
+
+    assert metric.model_usage == (UsageCount("gpt", 3),)
+    assert metric.model_usage[0].name == "gpt"
+    assert metric.model_usage[0].count == 3
+    assert metric.extension_usage == ()
+
+
+def test_usage_rows_accept_usage_model_instances():
+    metric = DashboardDailyMetric(
+        date=1700000000000,
+        model_usage=[ModelUsage(name="gpt", count=3)],
+        extension_usage=[ExtensionUsage(name="python", count=2)],
+    )
+
+    assert metric.model_usage == (UsageCount("gpt", 3),)
+    assert metric.extension_usage == (UsageCount("python", 2),)
+
+
+def test_usage_rows_serialize_as_api_objects():
+    metric = DashboardDailyMetric(date=1700000000000, model_usage=[{"name": "gpt", "count": 3}])
+
+    dumped = metric.model_dump(by_alias=True)
+
+    assert dumped["modelUsage"] == [{"name": "gpt", "count": 3}]
+    assert DashboardDailyMetric.model_validate_json(metric.model_dump_json(by_alias=True)) == metric
+
+
+def test_usage_rows_reject_negative_counts():
+    with pytest.raises(ValueError):
+        DashboardDailyMetric(date=1700000000000, model_usage=[{"name": "gpt", "count": -1}])
+
+
+def test_usage_event_parses_epoch_millisecond_strings():
+    event = UsageEvent.model_validate({"timestamp": "1700000000000"})
+
+    assert event.timestamp == datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("value", ["²", "¹²³"])
+def test_usage_event_rejects_non_ascii_digit_timestamps(value):
+    with pytest.raises(ValidationError):
+        UsageEvent.model_validate({"timestamp": value})
+
+
+def test_daily_metric_timestamp_is_aware_and_comparable_with_events():
+    metric = DashboardDailyMetric(date=1700000000000)
+    event = UsageEvent.model_validate({"timestamp": "1700000000000"})
+
+    assert metric.timestamp.tzinfo is not None
+    assert metric.timestamp.date() == datetime.fromtimestamp(1700000000).date()
+    assert metric.timestamp == event.timestamp
@@ -0,0 +1,37 @@
+"""Tests for Retry-After parsing."""
+
+import pytest
+
+from cursor_admin_sdk.client import _extract_retry_after
+from cursor_admin_sdk.retry import parse_retry_after
+
+
+class _Response:
+    """Minimal stand-in exposing only the headers _extract_retry_after reads."""
+
+    def __init__(self, headers):
+        self.headers = headers
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("120", 120.0),
+    ("0", 0.0),
+    ("1.5", 1.5),
+    ("-3", 0.0),
+])
+def test_parse_retry_after_delay_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_past_http_date():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+@pytest.mark.parametrize("value", ["inf", "-inf", "nan", "1e400", "9" * 400, "9" * 5000, "²", "soon"])
+def test_parse_retry_after_rejects_invalid_values(value):
+    assert parse_retry_after(value) is None
+
+
+@pytest.mark.parametrize("value", ["inf", "nan", "1e400", "9" * 400])
+def test_extract_retry_after_ignores_non_finite_hints(value):
+    assert _extract_retry_after(_Response({"Retry-After": value})) is None